@@ -0,0 +1,31 @@
+"""Request-scoped access to the active MCP server.
+
+Kept free of service and MCP SDK imports so tool modules can load it cheaply.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apps.mcp_server.server import MCPServer
+
+# Server handling the current request; set once per dispatch via MCPServer.activate()
+_current_server: ContextVar[MCPServer] = ContextVar("mcp_server")
+
+
+def current_server() -> MCPServer:
+    """
+    Return the MCPServer active in the current context.
+
+    Returns:
+        The server set by the enclosing MCPServer.activate() block
+
+    Raises:
+        RuntimeError: If no server is active
+    """
+    try:
+        return _current_server.get()
+    except LookupError:
+        raise RuntimeError("No active MCPServer; call tools inside MCPServer.activate()")
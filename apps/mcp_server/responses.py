@@ -0,0 +1,49 @@
+"""Serialization of tool responses for the MCP transport."""
+
+import orjson
+
+
+class RawJSON:
+    """Already-serialized JSON that is embedded in a response verbatim."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        """Wrap serialized JSON.
+
+        Args:
+            data: UTF-8 JSON bytes
+        """
+        self.data = data
+
+
+def _default(obj: object) -> object:
+    """Serialize values orjson doesn't handle natively.
+
+    Args:
+        obj: Value orjson could not serialize
+
+    Returns:
+        An orjson.Fragment for RawJSON values
+
+    Raises:
+        TypeError: For any other type
+    """
+    if isinstance(obj, RawJSON):
+        return orjson.Fragment(obj.data)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def encode_response(response: dict) -> bytes:
+    """
+    Serialize a tool response to JSON bytes.
+
+    RawJSON values are copied into the output without being parsed again.
+
+    Args:
+        response: Tool response dict
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps(response, default=_default)
@@ -1,9 +1,109 @@
 """MCP Server implementation for JSON Schema document management."""
 
+import contextlib
+import inspect
+from collections.abc import Callable, Iterator
+
 from json_schema_core.services.document_service import DocumentService
 from json_schema_core.services.schema_service import SchemaService
+from mcp import types
 from mcp.server import Server
 
+from apps.mcp_server.context import _current_server
+from apps.mcp_server.responses import encode_response
+from apps.mcp_server.tools import TOOLS
+
+# JSON Schema types for the builtin annotations used by tool parameters
+_JSON_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object",
+    "None": "null",
+}
+
+
+def _param_schema(annotation: object) -> dict:
+    """Build the JSON Schema for a tool parameter from its annotation.
+
+    Args:
+        annotation: Parameter annotation; a string under postponed evaluation
+
+    Returns:
+        Schema with the parameter's type, or {} for Any and unknown annotations
+    """
+    if not isinstance(annotation, str):
+        annotation = getattr(annotation, "__name__", "Any")
+    # Drop generic arguments: list[dict] -> list
+    names = [part.strip().split("[")[0] for part in annotation.split("|")]
+    json_types = [_JSON_TYPES.get(name) for name in names]
+    if None in json_types:
+        return {}
+    return {"type": json_types[0] if len(json_types) == 1 else json_types}
+
+
+def _arg_descriptions(doc: str) -> dict[str, str]:
+    """Collect parameter descriptions from the Args section of a docstring.
+
+    Args:
+        doc: Cleaned docstring (inspect.getdoc)
+
+    Returns:
+        Description per parameter name, with continuation lines joined
+    """
+    descriptions = {}
+    lines = iter(doc.splitlines())
+    for line in lines:
+        if line.strip() == "Args:":
+            break
+    name = indent = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            break
+        line_indent = len(line) - len(line.lstrip())
+        if indent is None:
+            indent = line_indent
+        if line_indent == indent:
+            name, _, text = stripped.partition(":")
+            descriptions[name] = text.strip()
+        elif name is not None:
+            descriptions[name] += " " + stripped
+    return descriptions
+
+
+def _tool_definition(name: str, tool: Callable[..., dict]) -> types.Tool:
+    """Describe a tool for list_tools from its signature and docstring.
+
+    Args:
+        name: Tool name (a key of TOOLS)
+        tool: Tool implementation
+
+    Returns:
+        MCP tool definition; server is never exposed as an argument
+    """
+    doc = inspect.getdoc(tool)
+    descriptions = _arg_descriptions(doc)
+    params = [p for p in inspect.signature(tool).parameters.values() if p.name != "server"]
+
+    properties = {}
+    for p in params:
+        properties[p.name] = _param_schema(p.annotation)
+        if p.name in descriptions:
+            properties[p.name]["description"] = descriptions[p.name]
+
+    return types.Tool(
+        name=name,
+        description=doc.splitlines()[0],
+        inputSchema={
+            "type": "object",
+            "properties": properties,
+            "required": [p.name for p in params if p.default is inspect.Parameter.empty],
+        },
+    )
+
 
 class MCPServer:
     """MCP Server for document operations."""
@@ -20,4 +120,49 @@ class MCPServer:
         self.schema_service = schema_service
         self.name = "json-schema-mcp-server"
         self.server = Server(self.name)
+        self.server.list_tools()(self._list_tools)
+        self.server.call_tool()(self._handle_call_tool)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["MCPServer"]:
+        """
+        Make this server the one tools use when no server argument is passed.
+
+        Yields:
+            This server instance
+        """
+        token = _current_server.set(self)
+        try:
+            yield self
+        finally:
+            _current_server.reset(token)
+
+    def call_tool(self, name: str, arguments: dict | None = None) -> dict:
+        """
+        Dispatch a tool call by name with this server active.
 
+        Args:
+            name: Tool name (a key of TOOLS)
+            arguments: Keyword arguments for the tool, without server
+
+        Returns:
+            The tool's response dict, or an unknown-tool error
+        """
+        tool = TOOLS.get(name)
+        if tool is None:
+            return {"error": "unknown-tool", "message": f"Unknown tool: {name}"}
+
+        with self.activate():
+            return tool(**(arguments or {}))
+
+    async def _list_tools(self) -> list[types.Tool]:
+        """List TOOLS for the MCP list_tools request."""
+        return [_tool_definition(name, tool) for name, tool in TOOLS.items()]
+
+    async def _handle_call_tool(self, name: str, arguments: dict) -> list[types.TextContent]:
+        """Run an MCP call_tool request through call_tool.
+
+        The response is serialized with encode_response so RawJSON values are sent verbatim.
+        """
+        text = encode_response(self.call_tool(name, arguments)).decode()
+        return [types.TextContent(type="text", text=text)]
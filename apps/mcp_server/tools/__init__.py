@@ -1 +1,27 @@
 """MCP tools for document and schema operations."""
+
+from typing import Callable
+
+from apps.mcp_server.tools.document_tools import (
+    document_create,
+    document_create_node,
+    document_delete_node,
+    document_list,
+    document_read_node,
+    document_update_node,
+    document_update_nodes,
+)
+from apps.mcp_server.tools.schema_tools import schema_get_node, schema_get_root
+
+# Tool name -> implementation; the single dispatch table used by MCPServer.call_tool
+TOOLS: dict[str, Callable[..., dict]] = {
+    "document_create": document_create,
+    "document_read_node": document_read_node,
+    "document_update_node": document_update_node,
+    "document_update_nodes": document_update_nodes,
+    "document_create_node": document_create_node,
+    "document_delete_node": document_delete_node,
+    "document_list": document_list,
+    "schema_get_node": schema_get_node,
+    "schema_get_root": schema_get_root,
+}
@@ -1,6 +1,9 @@
 """MCP tools for document operations."""
 
-from typing import Any
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Callable
 
 from json_schema_core.domain.errors import (
     DocumentNotFoundError,
@@ -9,16 +12,78 @@ from json_schema_core.domain.errors import (
     VersionConflictError,
 )
 
-from apps.mcp_server.server import MCPServer
+from apps.mcp_server.context import current_server
+from apps.mcp_server.responses import RawJSON
+
+if TYPE_CHECKING:
+    from apps.mcp_server.server import MCPServer
+
+# Error response builders, keyed by exception class
+_ERROR_MAP: dict[type[Exception], Callable[[Exception], dict]] = {
+    DocumentNotFoundError: lambda e: {
+        "error": "document-not-found",
+        "message": str(e),
+        "doc_id": e.doc_id,
+    },
+    PathNotFoundError: lambda e: {
+        "error": "path-not-found",
+        "message": str(e),
+        "path": e.path,
+    },
+    VersionConflictError: lambda e: {
+        "error": "version-conflict",
+        "message": str(e),
+        "expected": e.expected,
+        "actual": e.actual_version,
+    },
+    ValidationFailedError: lambda e: {
+        "error": "validation-failed",
+        "message": str(e),
+        "details": e.errors,
+    },
+}
+_MAPPED_ERRORS = tuple(_ERROR_MAP)
+
+
+def mcp_errors(default_code: str) -> Callable:
+    """
+    Decorate a tool so that raised exceptions are returned as error responses.
+
+    Args:
+        default_code: Error code for exceptions that have no entry in the error map
+
+    Returns:
+        Decorator wrapping the tool function
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> dict:
+            try:
+                return fn(*args, **kwargs)
+            except _MAPPED_ERRORS as e:
+                # Subclasses of a mapped error use the nearest mapped base's builder
+                for cls in type(e).__mro__:
+                    if cls in _ERROR_MAP:
+                        return _ERROR_MAP[cls](e)
+                return {"error": default_code, "message": str(e)}
+            except Exception as e:
+                # Catch any other errors
+                return {"error": default_code, "message": str(e)}
+
+        return wrapper
 
+    return decorator
 
-def document_create(server: MCPServer, schema_id: str) -> dict:
+
+@mcp_errors("creation-failed")
+def document_create(server: MCPServer | None = None, schema_id: str = "document") -> dict:
     """
     Create a new document with auto-generated ID.
 
     Args:
-        server: MCPServer instance
-        schema_id: Schema ID to validate against
+        server: MCPServer instance, or None for the active server
+        schema_id: Schema ID to validate against (default "document")
 
     Returns:
         dict with doc_id and version
@@ -27,37 +92,32 @@ def document_create(server: MCPServer, schema_id: str) -> dict:
         ValidationFailedError: If document cannot be created
             (e.g., required fields without defaults)
     """
-    try:
-        # Create empty document - defaults will be applied by DocumentService
-        empty_doc = {}
-
-        # Call DocumentService to create document
-        doc_id, metadata = server.document_service.create_document(
-            schema_id=schema_id, document=empty_doc
-        )
-
-        return {"doc_id": str(doc_id), "version": metadata.version}
-
-    except ValidationFailedError as e:
-        # Return error response
-        return {
-            "error": "validation-failed",
-            "message": str(e),
-            "details": e.errors if hasattr(e, "errors") else [],
-        }
-    except Exception as e:
-        # Catch any other errors
-        return {"error": "creation-failed", "message": str(e)}
-
-
-def document_read_node(doc_id: str, node_path: str, server: MCPServer) -> dict:
+    # Create empty document - defaults will be applied by DocumentService
+    empty_doc = {}
+
+    server = server or current_server()
+
+    # Call DocumentService to create document
+    doc_id, metadata = server.document_service.create_document(
+        schema_id=schema_id, document=empty_doc
+    )
+
+    return {"doc_id": doc_id, "version": metadata.version}
+
+
+@mcp_errors("read-failed")
+def document_read_node(
+    doc_id: str, node_path: str, raw: bool = False, server: MCPServer | None = None
+) -> dict:
     """
     Read a node from a document.
 
     Args:
         doc_id: Document ID
         node_path: JSON Pointer path to the node (e.g., "/", "/title", "/sections/0")
-        server: MCPServer instance
+        raw: For root reads, return the stored JSON as RawJSON instead of parsing it
+            (serialize the response with encode_response)
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with content and version
@@ -66,32 +126,26 @@ def document_read_node(doc_id: str, node_path: str, server: MCPServer) -> dict:
         DocumentNotFoundError: If document doesn't exist
         PathNotFoundError: If path doesn't exist in document
     """
-    try:
-        # Call DocumentService to read node
-        content, version = server.document_service.read_node(
-            doc_id=doc_id, node_path=node_path
-        )
-
-        return {"content": content, "version": version}
-
-    except DocumentNotFoundError as e:
-        return {
-            "error": "document-not-found",
-            "message": str(e),
-            "doc_id": doc_id,
-        }
-    except PathNotFoundError as e:
-        return {
-            "error": "path-not-found",
-            "message": str(e),
-            "path": node_path,
-        }
-    except Exception as e:
-        return {"error": "read-failed", "message": str(e)}
+    server = server or current_server()
+
+    # Whole document requested as-is: hand back the stored bytes unparsed
+    if raw and node_path in ("", "/"):
+        content, version = server.document_service.read_document_bytes(doc_id)
+        return {"content": RawJSON(content), "version": version}
+
+    # Call DocumentService to read node
+    content, version = server.document_service.read_node(doc_id=doc_id, node_path=node_path)
 
+    return {"content": content, "version": version}
 
+
+@mcp_errors("update-failed")
 def document_update_node(
-    doc_id: str, node_path: str, value: Any, expected_version: int, server: MCPServer
+    doc_id: str,
+    node_path: str,
+    value: Any,
+    expected_version: int | None = None,
+    server: MCPServer | None = None,
 ) -> dict:
     """
     Update a node in a document.
@@ -100,8 +154,8 @@ def document_update_node(
         doc_id: Document ID
         node_path: JSON Pointer path to the node to update
         value: New value for the node
-        expected_version: Expected version for optimistic locking
-        server: MCPServer instance
+        expected_version: Expected version for optimistic locking (None skips the check)
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with updated content and new version
@@ -112,48 +166,63 @@ def document_update_node(
         VersionConflictError: If version doesn't match
         ValidationFailedError: If update violates schema
     """
-    try:
-        # Call DocumentService to update node
-        content, version = server.document_service.update_node(
-            doc_id=doc_id,
-            node_path=node_path,
-            value=value,
-            expected_version=expected_version,
-        )
-
-        return {"content": content, "version": version}
-
-    except DocumentNotFoundError as e:
-        return {
-            "error": "document-not-found",
-            "message": str(e),
-            "doc_id": doc_id,
-        }
-    except PathNotFoundError as e:
-        return {
-            "error": "path-not-found",
-            "message": str(e),
-            "path": node_path,
-        }
-    except VersionConflictError as e:
-        return {
-            "error": "version-conflict",
-            "message": str(e),
-            "expected": expected_version,
-            "actual": e.actual_version if hasattr(e, "actual_version") else None,
-        }
-    except ValidationFailedError as e:
-        return {
-            "error": "validation-failed",
-            "message": str(e),
-            "details": e.errors if hasattr(e, "errors") else [],
-        }
-    except Exception as e:
-        return {"error": "update-failed", "message": str(e)}
+    server = server or current_server()
+
+    # Call DocumentService to update node
+    content, version = server.document_service.update_node(
+        doc_id=doc_id,
+        node_path=node_path,
+        value=value,
+        expected_version=expected_version,
+    )
+
+    return {"content": content, "version": version}
+
+
+@mcp_errors("update-failed")
+def document_update_nodes(
+    doc_id: str,
+    patches: list[dict],
+    expected_version: int | None = None,
+    server: MCPServer | None = None,
+) -> dict:
+    """
+    Update several nodes in a document with a single validation and save.
+
+    Args:
+        doc_id: Document ID
+        patches: List of {"path": ..., "value": ...} updates, applied in order
+        expected_version: Expected version for optimistic locking (None skips the check)
+        server: MCPServer instance (defaults to the active server)
+
+    Returns:
+        dict with updated contents (one per patch) and new version
+
+    Raises:
+        DocumentNotFoundError: If document doesn't exist
+        PathNotFoundError: If a path doesn't exist
+        VersionConflictError: If version doesn't match
+        ValidationFailedError: If the updates violate schema
+    """
+    server = server or current_server()
+
+    # Call DocumentService to apply all patches in one write
+    contents, version = server.document_service.apply_patches(
+        doc_id=doc_id,
+        patches=patches,
+        expected_version=expected_version,
+    )
 
+    return {"contents": contents, "version": version}
 
+
+@mcp_errors("create-node-failed")
 def document_create_node(
-    doc_id: str, node_path: str, value: Any, expected_version: int, server: MCPServer
+    doc_id: str,
+    node_path: str,
+    value: Any,
+    expected_version: int | None = None,
+    server: MCPServer | None = None,
 ) -> dict:
     """
     Create a new node in a document (typically in an array).
@@ -162,8 +231,8 @@ def document_create_node(
         doc_id: Document ID
         node_path: JSON Pointer path to the array or object to add to
         value: Value to add
-        expected_version: Expected version for optimistic locking
-        server: MCPServer instance
+        expected_version: Expected version for optimistic locking (None skips the check)
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with created_path and new version
@@ -174,60 +243,25 @@ def document_create_node(
         VersionConflictError: If version doesn't match
         ValidationFailedError: If creation violates schema
     """
-    try:
-        # Call DocumentService to create node (uses parent_path parameter)
-        created_value, version = server.document_service.create_node(
-            doc_id=doc_id,
-            parent_path=node_path,
-            value=value,
-            expected_version=expected_version,
-        )
-
-        # Read back the parent to determine the index where the value was added
-        # For arrays, the new item is at the end
-        parent_content, _ = server.document_service.read_node(doc_id=doc_id, node_path=node_path)
-
-        if isinstance(parent_content, list):
-            # Find the index (last item)
-            index = len(parent_content) - 1
-            created_path = f"{node_path}/{index}"
-        else:
-            # For dicts or other types, just return the parent path
-            created_path = node_path
-
-        return {"created_path": created_path, "version": version}
-
-    except DocumentNotFoundError as e:
-        return {
-            "error": "document-not-found",
-            "message": str(e),
-            "doc_id": doc_id,
-        }
-    except PathNotFoundError as e:
-        return {
-            "error": "path-not-found",
-            "message": str(e),
-            "path": node_path,
-        }
-    except VersionConflictError as e:
-        return {
-            "error": "version-conflict",
-            "message": str(e),
-            "expected": expected_version,
-            "actual": e.actual_version if hasattr(e, "actual_version") else None,
-        }
-    except ValidationFailedError as e:
-        return {
-            "error": "validation-failed",
-            "message": str(e),
-            "details": e.errors if hasattr(e, "errors") else [],
-        }
-    except Exception as e:
-        return {"error": "create-node-failed", "message": str(e)}
+    server = server or current_server()
+
+    # Call DocumentService to create node (uses parent_path parameter)
+    created_path, version = server.document_service.create_node(
+        doc_id=doc_id,
+        parent_path=node_path,
+        value=value,
+        expected_version=expected_version,
+    )
+
+    return {"created_path": created_path, "version": version}
 
 
+@mcp_errors("delete-node-failed")
 def document_delete_node(
-    doc_id: str, node_path: str, expected_version: int, server: MCPServer
+    doc_id: str,
+    node_path: str,
+    expected_version: int | None = None,
+    server: MCPServer | None = None,
 ) -> dict:
     """
     Delete a node from a document.
@@ -235,8 +269,8 @@ def document_delete_node(
     Args:
         doc_id: Document ID
         node_path: JSON Pointer path to the node to delete
-        expected_version: Expected version for optimistic locking
-        server: MCPServer instance
+        expected_version: Expected version for optimistic locking (None skips the check)
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with deleted content and new version
@@ -247,53 +281,27 @@ def document_delete_node(
         VersionConflictError: If version doesn't match
         ValidationFailedError: If deletion violates schema
     """
-    try:
-        # Call DocumentService to delete node
-        deleted_value, version = server.document_service.delete_node(
-            doc_id=doc_id,
-            node_path=node_path,
-            expected_version=expected_version,
-        )
-
-        return {"content": deleted_value, "version": version}
-
-    except DocumentNotFoundError as e:
-        return {
-            "error": "document-not-found",
-            "message": str(e),
-            "doc_id": doc_id,
-        }
-    except PathNotFoundError as e:
-        return {
-            "error": "path-not-found",
-            "message": str(e),
-            "path": node_path,
-        }
-    except VersionConflictError as e:
-        return {
-            "error": "version-conflict",
-            "message": str(e),
-            "expected": expected_version,
-            "actual": e.actual_version if hasattr(e, "actual_version") else None,
-        }
-    except ValidationFailedError as e:
-        return {
-            "error": "validation-failed",
-            "message": str(e),
-            "details": e.errors if hasattr(e, "errors") else [],
-        }
-    except Exception as e:
-        return {"error": "delete-node-failed", "message": str(e)}
-
-
-def document_list(limit: int = 100, offset: int = 0, server: MCPServer = None) -> dict:
+    server = server or current_server()
+
+    # Call DocumentService to delete node
+    deleted_value, version = server.document_service.delete_node(
+        doc_id=doc_id,
+        node_path=node_path,
+        expected_version=expected_version,
+    )
+
+    return {"content": deleted_value, "version": version}
+
+
+@mcp_errors("list-failed")
+def document_list(limit: int = 100, offset: int = 0, server: MCPServer | None = None) -> dict:
     """
     List all documents with metadata.
 
     Args:
         limit: Maximum number of documents to return (default 100)
         offset: Number of documents to skip (default 0)
-        server: MCPServer instance
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with list of document metadata
@@ -301,16 +309,9 @@ def document_list(limit: int = 100, offset: int = 0, server: MCPServer = None) -
     Raises:
         None - always returns a valid response
     """
-    try:
-        # Call DocumentService to list documents
-        documents = server.document_service.list_documents(limit=limit, offset=offset)
-
-        return {"documents": documents}
-
-    except Exception as e:
-        return {"error": "list-failed", "message": str(e)}
-
-
-
+    server = server or current_server()
 
+    # Call DocumentService to list documents
+    documents = server.document_service.list_documents(limit=limit, offset=offset)
 
+    return {"documents": documents}
@@ -1,19 +1,27 @@
 """MCP tools for schema introspection operations."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from json_schema_core.domain.errors import PathNotFoundError
-from json_schema_core.utils.json_pointer import resolve_pointer
 
-from apps.mcp_server.server import MCPServer
+from apps.mcp_server.context import current_server
+
+if TYPE_CHECKING:
+    from apps.mcp_server.server import MCPServer
 
 
-def schema_get_node(node_path: str, dereferenced: bool = True, server: MCPServer = None) -> dict:
+def schema_get_node(
+    node_path: str, dereferenced: bool = True, server: MCPServer | None = None
+) -> dict:
     """
     Get the schema for a specific node path.
 
     Args:
         node_path: JSON Pointer path to the node (e.g., "/", "/title", "/properties/name")
         dereferenced: Whether to resolve $ref references (default True)
-        server: MCPServer instance
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with schema definition
@@ -22,16 +30,11 @@ def schema_get_node(node_path: str, dereferenced: bool = True, server: MCPServer
         PathNotFoundError: If path doesn't exist in schema
     """
     try:
-        # Get the full schema
+        # Navigate to the requested path (resolved nodes are cached per path)
         # Note: We're using 'document' as the default schema ID for now
         # In a full implementation, this would be configurable
-        schema = server.schema_service.load_schema("document")
-
-        # Navigate to the requested path
-        if node_path == "/":
-            result_schema = schema
-        else:
-            result_schema = resolve_pointer(schema, node_path)
+        server = server or current_server()
+        result_schema = server.schema_service.get_schema_node("document", node_path)
 
         return {"schema": result_schema}
 
@@ -45,13 +48,13 @@ def schema_get_node(node_path: str, dereferenced: bool = True, server: MCPServer
         return {"error": "schema-get-node-failed", "message": str(e)}
 
 
-def schema_get_root(dereferenced: bool = True, server: MCPServer = None) -> dict:
+def schema_get_root(dereferenced: bool = True, server: MCPServer | None = None) -> dict:
     """
     Get the root schema.
 
     Args:
         dereferenced: Whether to resolve $ref references (default True)
-        server: MCPServer instance
+        server: MCPServer instance (defaults to the active server)
 
     Returns:
         dict with root schema definition
@@ -62,6 +65,7 @@ def schema_get_root(dereferenced: bool = True, server: MCPServer = None) -> dict
     try:
         # Load the full schema
         # Note: We're using 'document' as the default schema ID for now
+        server = server or current_server()
         schema = server.schema_service.load_schema("document")
 
         return {"schema": schema}
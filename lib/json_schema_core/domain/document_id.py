@@ -1,18 +1,32 @@
 """DocumentId value object - wraps ULID for document identification."""
 
+import os
+import re
+import threading
+import time
+
 from ulid import ULID
 
+# Canonical ULID: 26 Crockford base32 characters (no I, L, O, U); the leading
+# character is at most 7 because the timestamp is 48 bits
+_ULID_RE = re.compile(r"[0-7][0-9A-HJKMNP-TV-Z]{25}")
 
-class DocumentId:
-    """Value object representing a document identifier using ULID."""
+# ULID layout: 48-bit millisecond timestamp followed by 80 bits of randomness
+_RANDOM_BITS = 80
 
-    def __init__(self, value: str):
-        """Create DocumentId from a ULID string.
+# Last (timestamp ms, randomness) handed out by generate_mono
+_mono_lock = threading.Lock()
+_mono_last = (0, 0)
 
-        Args:
-            value: ULID string (26 characters)
-        """
-        self._value = value
+
+class DocumentId(str):
+    """Value object representing a document identifier using ULID.
+
+    Subclasses ``str`` so an id can be used anywhere a plain string is expected
+    (storage keys, metadata, responses) without conversion.
+    """
+
+    __slots__ = ()
 
     @classmethod
     def generate(cls) -> "DocumentId":
@@ -23,10 +37,66 @@ class DocumentId:
         """
         return cls(str(ULID()))
 
-    def __str__(self) -> str:
-        """Convert DocumentId to string representation.
+    @classmethod
+    def generate_mono(cls) -> "DocumentId":
+        """Generate a DocumentId that sorts after every id this method returned before.
+
+        Follows the ULID monotonic rule: within the same millisecond (or if the
+        clock steps back) the previous randomness is incremented instead of
+        drawing new random bits, so ids from one process are strictly ordered.
+
+        Returns:
+            New DocumentId instance with a monotonic ULID
+        """
+        global _mono_last
+
+        with _mono_lock:
+            timestamp = time.time_ns() // 1_000_000
+            last_timestamp, last_randomness = _mono_last
+            if timestamp <= last_timestamp:
+                timestamp = last_timestamp
+                randomness = last_randomness + 1
+                if randomness >> _RANDOM_BITS:
+                    # Randomness exhausted within this millisecond; borrow the next one
+                    timestamp += 1
+                    randomness = int.from_bytes(os.urandom(10), "big")
+            else:
+                randomness = int.from_bytes(os.urandom(10), "big")
+            _mono_last = (timestamp, randomness)
+
+        value = (timestamp << _RANDOM_BITS) | randomness
+        return cls.from_bytes(value.to_bytes(16, "big"))
+
+    @staticmethod
+    def is_valid(value: str) -> bool:
+        """Check whether a string is a canonical (uppercase) ULID.
+
+        Args:
+            value: Candidate document identifier
+
+        Returns:
+            True if value is 26 Crockford base32 characters encoding a ULID
+        """
+        return _ULID_RE.fullmatch(value) is not None
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DocumentId":
+        """Create a DocumentId from the 16-byte binary form of a ULID.
+
+        Args:
+            data: ULID bytes (16 bytes)
+
+        Returns:
+            DocumentId instance for the encoded ULID
+        """
+        return cls(str(ULID.from_bytes(data)))
+
+    def to_bytes(self) -> bytes:
+        """Convert DocumentId to the 16-byte binary form of its ULID.
+
+        Computed on demand; the string form remains the canonical storage key.
 
         Returns:
-            ULID string
+            ULID bytes (16 bytes)
         """
-        return self._value
+        return ULID.from_str(self).bytes
@@ -4,14 +4,19 @@
 class PathNotFoundError(Exception):
     """Raised when a file system path is not found."""
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, segment: str | None = None):
         """Initialize with the path that was not found.
 
         Args:
             path: The file system path that was not found
+            segment: The path component that could not be followed, if known
         """
         self.path = path
-        super().__init__(f"Path not found: {path}")
+        self.segment = segment
+        if segment is None:
+            super().__init__(f"Path not found: {path}")
+        else:
+            super().__init__(f"Path not found: {path} (cannot follow {segment!r})")
 
 
 class VersionConflictError(Exception):
@@ -25,9 +30,14 @@ class VersionConflictError(Exception):
             actual: The actual version found
         """
         self.expected = expected
-        self.actual = actual
+        self.actual_version = actual
         super().__init__(f"Version conflict: expected {expected}, but found {actual}")
 
+    @property
+    def actual(self) -> int:
+        """The actual version found (alias of actual_version)."""
+        return self.actual_version
+
 
 class ValidationFailedError(Exception):
     """Raised when JSON Schema validation fails."""
@@ -1,17 +1,27 @@
 """DocumentMetadata value object."""
 
+import dataclasses
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel, Field
 
+@dataclass(slots=True, frozen=True)
+class DocumentMetadata:
+    """Metadata for a document including versioning information.
 
-class DocumentMetadata(BaseModel):
-    """Metadata for a document including versioning information."""
+    Attributes:
+        doc_id: Document identifier (ULID)
+        version: Document version for optimistic locking
+        created_at: Creation timestamp
+        updated_at: Last update timestamp
+        schema_id: ID of the schema the document is validated against
+    """
 
-    doc_id: str = Field(..., description="Document identifier (ULID)")
-    version: int = Field(..., description="Document version for optimistic locking", ge=1)
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    doc_id: str
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    schema_id: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict) -> "DocumentMetadata":
@@ -37,6 +47,7 @@ class DocumentMetadata(BaseModel):
             version=data["version"],
             created_at=created_at,
             updated_at=updated_at,
+            schema_id=data.get("schema_id"),
         )
 
     def to_dict(self) -> dict:
@@ -50,17 +61,19 @@ class DocumentMetadata(BaseModel):
             "version": self.version,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
+            "schema_id": self.schema_id,
         }
 
-    def increment_version(self) -> "DocumentMetadata":
+    def increment_version(self, now: datetime | None = None) -> "DocumentMetadata":
         """Create a new metadata instance with incremented version and updated timestamp.
 
+        Args:
+            now: Timestamp to record as updated_at; taken from the clock when omitted.
+                Lets callers that write several documents share one timestamp.
+
         Returns:
-            New DocumentMetadata with version+1 and current timestamp
+            New DocumentMetadata with version+1 and the new timestamp
         """
-        return DocumentMetadata(
-            doc_id=self.doc_id,
-            version=self.version + 1,
-            created_at=self.created_at,
-            updated_at=datetime.now(),
-        )
+        if now is None:
+            now = datetime.now()
+        return dataclasses.replace(self, version=self.version + 1, updated_at=now)
@@ -2,16 +2,65 @@
 DocumentService - Core CRUD operations for documents
 """
 
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from json_schema_core.domain.document_id import DocumentId
-from json_schema_core.domain.errors import DocumentNotFoundError, VersionConflictError
+from json_schema_core.domain.errors import (
+    DocumentNotFoundError,
+    PathNotFoundError,
+    VersionConflictError,
+)
 from json_schema_core.domain.metadata import DocumentMetadata
 from json_schema_core.services.schema_service import SchemaService
 from json_schema_core.services.validation_service import ValidationService
 from json_schema_core.storage.storage_interface import StorageInterface
-from json_schema_core.utils.json_pointer import delete_pointer, resolve_pointer, set_pointer
+from json_schema_core.utils.json_pointer import (
+    delete_pointer_inplace,
+    resolve_pointer,
+    set_pointer_inplace,
+    tokenize_pointer,
+)
+
+# Number of (schema_id, content hash) pairs remembered as already valid
+MAX_VALIDATED_DOCUMENTS = 1024
+
+
+class DocumentBatch:
+    """Node mutations queued for one document and applied together by DocumentService.batch"""
+
+    def __init__(self, doc_id: str):
+        """
+        Start an empty batch
+
+        Args:
+            doc_id: The ID of the document the mutations apply to
+        """
+        self.doc_id = doc_id
+        self.ops: list[tuple[str, str, Any]] = []
+        # Filled in when the batch is applied
+        self.results: list[Any] = []
+        self.version: int | None = None
+
+    def update_node(self, node_path: str, value: Any) -> None:
+        """Queue setting the node at node_path to value"""
+        self.ops.append(("update", node_path, value))
+
+    def create_node(self, parent_path: str, value: Any) -> None:
+        """Queue appending value to the array at parent_path"""
+        self.ops.append(("create", parent_path, value))
+
+    def delete_node(self, node_path: str) -> None:
+        """Queue deleting the node at node_path"""
+        if node_path == "/":
+            raise ValueError("Cannot delete root node")
+        self.ops.append(("delete", node_path, None))
 
 
 class DocumentService:
@@ -27,7 +76,64 @@ class DocumentService:
         """
         self.storage = storage
         self.schema_service = schema_service
-        self._schema_cache: dict[str, dict] = {}
+        # Documents already validated at creation, so repeated submissions skip validation
+        self._valid_cache: OrderedDict[tuple[str, bytes], None] = OrderedDict()
+
+    def _validator_for(self, metadata_dict: dict) -> ValidationService | None:
+        """
+        Get the validator for the schema recorded in a document's metadata
+
+        Args:
+            metadata_dict: Stored metadata of the document
+
+        Returns:
+            ValidationService for the document's schema, or None for documents
+            stored without a schema_id
+        """
+        schema_id = metadata_dict.get("schema_id")
+        if schema_id is None:
+            return None
+        return self.schema_service.get_validator(schema_id)
+
+    def invalidate_schema(self, schema_id: str) -> None:
+        """
+        Drop the cached validation results and the SchemaService caches for a schema
+
+        Args:
+            schema_id: The ID of the schema to evict
+        """
+        for key in [key for key in self._valid_cache if key[0] == schema_id]:
+            del self._valid_cache[key]
+        self.schema_service.invalidate(schema_id)
+
+    def _validate_new_document(
+        self, schema_id: str, validation_service: ValidationService, document: dict
+    ) -> None:
+        """
+        Validate a document being created, remembering documents already found valid
+
+        Retries and batch imports often submit the same content again; those
+        repeats are recognized by a hash of the canonical JSON and not revalidated.
+
+        Args:
+            schema_id: The ID of the schema to validate against
+            validation_service: Compiled validator for that schema
+            document: The document to validate
+
+        Raises:
+            ValidationFailedError: If document fails schema validation
+        """
+        content = orjson.dumps(document, option=orjson.OPT_SORT_KEYS)
+        key = (schema_id, hashlib.blake2b(content, digest_size=16).digest())
+        if key in self._valid_cache:
+            self._valid_cache.move_to_end(key)
+            return
+
+        # Only successful validations are remembered
+        validation_service.validate(document)
+        self._valid_cache[key] = None
+        if len(self._valid_cache) > MAX_VALIDATED_DOCUMENTS:
+            self._valid_cache.popitem(last=False)
 
     def create_document(
         self, schema_id: str, document: dict, doc_id: str | None = None
@@ -50,51 +156,107 @@ class DocumentService:
         """
         # Validate and process custom ID if provided
         if doc_id is not None:
-            # Validate ID format (ULID should be 26 characters, uppercase alphanumeric)
-            if not (len(doc_id) == 26 and doc_id.isalnum() and doc_id.isupper()):
+            # Validate ID format (26 uppercase Crockford base32 characters)
+            if not DocumentId.is_valid(doc_id):
                 raise ValueError(f"Invalid document ID format: {doc_id}")
 
             # Check if document already exists
-            try:
-                self.storage.read_document(doc_id)
-                # If we get here, document exists
+            if self.storage.exists(doc_id):
                 raise ValueError(f"Document with ID {doc_id} already exists")
-            except Exception as e:
-                # If DocumentNotFoundError, that's good - ID is available
-                if "not found" not in str(e).lower():
-                    # Some other error occurred
-                    raise
-
-        # Load schema (with caching)
-        if schema_id not in self._schema_cache:
-            schema = self.schema_service.load_schema(schema_id)
-            self._schema_cache[schema_id] = schema
-        else:
-            schema = self._schema_cache[schema_id]
 
-        # Create validation service for this schema
-        validation_service = ValidationService(schema)
+        # Get the compiled validator for this schema (cached per schema_id by SchemaService)
+        validation_service = self.schema_service.get_validator(schema_id)
 
-        # Apply default values from schema
-        document_with_defaults = validation_service.apply_defaults(document)
+        # Apply default values from schema (skipping the walk if it declares none)
+        if validation_service.has_defaults:
+            document_with_defaults = validation_service.apply_defaults(document)
+        else:
+            document_with_defaults = document
 
-        # Validate document against schema
-        validation_service.validate(document_with_defaults)
+        # Validate document against schema (repeat submissions hit the cache)
+        self._validate_new_document(schema_id, validation_service, document_with_defaults)
 
         # Use custom ID or generate new one
         if doc_id is None:
-            doc_id = str(DocumentId.generate())
+            doc_id = DocumentId.generate()
 
         # Create metadata
         now = datetime.now()
-        metadata = DocumentMetadata(doc_id=doc_id, version=1, created_at=now, updated_at=now)
+        metadata = DocumentMetadata(
+            doc_id=doc_id, version=1, created_at=now, updated_at=now, schema_id=schema_id
+        )
 
         # Store document and metadata atomically
-        self.storage.write_document(doc_id, document_with_defaults)
-        self.storage.write_metadata(doc_id, metadata.model_dump(mode="json"))
+        self.storage.write_document_and_metadata(doc_id, document_with_defaults, metadata.to_dict())
 
         return doc_id, metadata
 
+    def _load_document(self, doc_id: str) -> tuple[dict, dict]:
+        """
+        Load a document together with its metadata dictionary
+
+        Args:
+            doc_id: The ID of the document to load
+
+        Returns:
+            Tuple of (document, metadata_dict)
+
+        Raises:
+            DocumentNotFoundError: If document or its metadata not found
+        """
+        # Storage raises DocumentNotFoundError itself for a missing document
+        document, metadata_dict = self.storage.read_document_with_metadata(doc_id)
+        if metadata_dict is None:
+            raise DocumentNotFoundError(doc_id)
+
+        return document, metadata_dict
+
+    def _next_metadata(self, metadata_dict: dict) -> dict:
+        """
+        Build the stored metadata for the next version of a document
+
+        Works on the stored dictionary directly: only version and updated_at
+        change, so the timestamps are not parsed and re-serialized.
+
+        Args:
+            metadata_dict: Stored metadata of the current version
+
+        Returns:
+            New metadata dictionary with version+1 and the current time as updated_at
+        """
+        return {
+            **metadata_dict,
+            "version": metadata_dict["version"] + 1,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+    def _commit(self, doc_id: str, document: dict, metadata_dict: dict) -> dict:
+        """
+        Store a modified document as the next version, atomically checking the version
+
+        Args:
+            doc_id: The ID of the document
+            document: The modified document
+            metadata_dict: Metadata of the version the modification was based on
+
+        Returns:
+            The stored metadata dictionary of the new version
+
+        Raises:
+            VersionConflictError: If the stored version changed since the document
+                was loaded
+            DocumentNotFoundError: If the document was deleted since it was loaded
+        """
+        base_version = metadata_dict["version"]
+        new_metadata = self._next_metadata(metadata_dict)
+        if not self.storage.cas_write(doc_id, base_version, document, new_metadata):
+            current = self.storage.read_metadata(doc_id)
+            if current is None:
+                # Deleted while this change was being prepared
+                raise DocumentNotFoundError(doc_id)
+            raise VersionConflictError(expected=base_version, actual=current["version"])
+        return new_metadata
+
     def read_node(self, doc_id: str, node_path: str) -> tuple[Any, int]:
         """
         Read a document or a specific node within a document using JSONPointer
@@ -110,32 +272,41 @@ class DocumentService:
             DocumentNotFoundError: If document not found
             PathNotFoundError: If node_path doesn't exist in document
         """
-        # Load document from storage
-        try:
-            document = self.storage.read_document(doc_id)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise DocumentNotFoundError(doc_id)
-            raise
-
-        # Load metadata to get version
-        metadata_dict = self.storage.read_metadata(doc_id)
-        if metadata_dict is None:
-            raise DocumentNotFoundError(doc_id)
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
 
         version = metadata_dict["version"]
 
         # Resolve the path in the document
-        if node_path == "/":
-            # Root path - return full document
+        if node_path in ("", "/"):
+            # Root path - return full document without pointer parsing
             return document, version
         else:
             # Use JSONPointer to resolve path
             value = resolve_pointer(document, node_path)
             return value, version
 
+    def read_document_bytes(self, doc_id: str) -> tuple[bytes, int]:
+        """
+        Read a whole document as serialized JSON, without parsing it
+
+        Args:
+            doc_id: The ID of the document to read
+
+        Returns:
+            Tuple of (document_json_bytes, version)
+
+        Raises:
+            DocumentNotFoundError: If document not found
+        """
+        metadata_dict = self.storage.read_metadata(doc_id)
+        if metadata_dict is None:
+            raise DocumentNotFoundError(doc_id)
+
+        return self.storage.read_document_bytes(doc_id), metadata_dict["version"]
+
     def update_node(
-        self, doc_id: str, node_path: str, value: Any, expected_version: int
+        self, doc_id: str, node_path: str, value: Any, expected_version: int | None = None
     ) -> tuple[Any, int]:
         """
         Update a node within a document using JSONPointer with optimistic locking
@@ -144,10 +315,12 @@ class DocumentService:
             doc_id: The ID of the document to update
             node_path: JSONPointer path to the node to update
             value: The new value to set
-            expected_version: Expected version for optimistic locking
+            expected_version: Expected version for optimistic locking, or None to skip
+                the version check
 
         Returns:
-            Tuple of (updated_value, new_version)
+            Tuple of (updated_value, new_version); if the node already holds value,
+            nothing is written and the current version is returned
 
         Raises:
             DocumentNotFoundError: If document not found
@@ -155,114 +328,121 @@ class DocumentService:
             ValidationFailedError: If updated document fails schema validation
             PathNotFoundError: If node_path doesn't exist in document
         """
-        # Load document from storage
-        try:
-            document = self.storage.read_document(doc_id)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise DocumentNotFoundError(doc_id)
-            raise
-
-        # Load metadata
-        metadata_dict = self.storage.read_metadata(doc_id)
-        if metadata_dict is None:
-            raise DocumentNotFoundError(doc_id)
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
 
-        # Check version for optimistic locking
+        # Check version for optimistic locking (None opts out of the check)
         current_version = metadata_dict["version"]
-        if current_version != expected_version:
+        if expected_version is not None and current_version != expected_version:
             raise VersionConflictError(expected=expected_version, actual=current_version)
 
-        # Update the node using JSONPointer (returns modified copy)
-        document = set_pointer(document, node_path, value)
-
-        # Get schema_id from document (we need to find it somehow)
-        # For now, we'll need to track schema_id in metadata or infer it
-        # Let's check if we stored any schema info
-        # Actually, we need to find the schema that was used to create this document
-        # For validation, we'll need to iterate through schemas or store schema_id in metadata
-        # For now, let's validate if we can find the schema
-
-        # Try to find the schema by checking all schemas in storage
-        # This is not ideal - we should store schema_id in metadata
-        # For now, let's skip validation or make it optional
-        # Actually, let's look for a way to get the schema
+        # Parse the path once for both the lookup and the update
+        tokens = tokenize_pointer(node_path)
 
-        # Better approach: We need the schema_id to validate
-        # Let's assume we can get it from somewhere, or we validate against all schemas
-        # For now, I'll add validation but we need schema_id
-
-        # TODO: We need to store schema_id in metadata in create_document
-        # For now, let's try to validate by finding schemas
-
-        # Let's try a different approach: validate against the schemas we have cached
-        # or require schema_id as parameter
-        # For MVP, let's validate if we have a cached schema
+        # Replacing an existing node leaves its parent's keys unchanged, so only the new
+        # value needs validating; adding a key can affect the parent (required, etc.)
+        try:
+            current = resolve_pointer(document, tokens)
+        except PathNotFoundError:
+            validate_path = node_path.rsplit("/", 1)[0]
+        else:
+            # Writing back the same value is a no-op: skip validation and the write.
+            # == alone treats 1, 1.0 and true as equal, so confirm on the JSON form
+            if current == value and orjson.dumps(current) == orjson.dumps(value):
+                return value, current_version
+            validate_path = node_path
 
-        if self._schema_cache:
-            # Use the first schema in cache (not ideal but works for now)
-            schema = next(iter(self._schema_cache.values()))
-            validation_service = ValidationService(schema)
-            validation_service.validate(document)
+        # The document was just loaded for this call, so update it in place
+        set_pointer_inplace(document, tokens, value)
 
-        # Convert metadata dict to DocumentMetadata object
-        metadata = DocumentMetadata(**metadata_dict)
+        # Validate against the schema recorded at creation
+        validation_service = self._validator_for(metadata_dict)
+        if validation_service is not None:
+            validation_service.validate_node(document, validate_path)
 
-        # Increment version and update timestamp (returns new instance)
-        metadata = metadata.increment_version()
+        # Store with the incremented version unless another writer committed first
+        metadata_dict = self._commit(doc_id, document, metadata_dict)
 
-        # Store updated document and metadata
-        self.storage.write_document(doc_id, document)
-        self.storage.write_metadata(doc_id, metadata.model_dump(mode="json"))
+        return value, metadata_dict["version"]
 
-        return value, metadata.version
+    def apply_patches(
+        self, doc_id: str, patches: list[dict], expected_version: int | None = None
+    ) -> tuple[list[Any], int]:
+        """
+        Apply several node updates as one write with optimistic locking
 
-    def create_node(
-        self, doc_id: str, parent_path: str, value: Any, expected_version: int
-    ) -> tuple[Any, int]:
-        """Create a new node by appending to array or adding to object.
+        The document is loaded once, every patch is applied in memory, and the
+        result is validated and saved once with a single version increment.
 
         Args:
-            doc_id: Document identifier
-            parent_path: JSONPointer to parent array or object
-            value: Value to append/add
-            expected_version: Expected document version for optimistic locking
+            doc_id: The ID of the document to update
+            patches: List of {"path": JSONPointer, "value": new value} dictionaries,
+                applied in order
+            expected_version: Expected version for optimistic locking, or None to skip
+                the version check
 
         Returns:
-            Tuple of (created_value, new_version)
+            Tuple of (updated_values, new_version)
 
         Raises:
-            DocumentNotFoundError: If document doesn't exist
-            PathNotFoundError: If parent_path doesn't exist
-            VersionConflictError: If version doesn't match
-            ValidationFailedError: If result violates schema
-            ValueError: If parent is not array/object
+            DocumentNotFoundError: If document not found
+            VersionConflictError: If expected_version doesn't match current version
+            ValidationFailedError: If updated document fails schema validation
+            PathNotFoundError: If a patch path doesn't exist in document
+            ValueError: If patches is empty
         """
-        # Load document from storage
-        try:
-            document = self.storage.read_document(doc_id)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise DocumentNotFoundError(doc_id)
-            raise
+        if not patches:
+            raise ValueError("No patches to apply")
 
-        # Load metadata
-        metadata_dict = self.storage.read_metadata(doc_id)
-        if metadata_dict is None:
-            raise DocumentNotFoundError(doc_id)
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
 
-        # Check version for optimistic locking
+        # Check version for optimistic locking (None opts out of the check)
         current_version = metadata_dict["version"]
-        if current_version != expected_version:
+        if expected_version is not None and current_version != expected_version:
             raise VersionConflictError(expected=expected_version, actual=current_version)
 
-        # Navigate to parent node
-        parent = resolve_pointer(document, parent_path)
+        # Apply every patch before validating; nothing is saved if any of them fails
+        for patch in patches:
+            set_pointer_inplace(document, patch["path"], patch["value"])
+
+        # Validate the modified document once
+        validation_service = self._validator_for(metadata_dict)
+        if validation_service is not None:
+            validation_service.validate(document)
+
+        # Store with the incremented version unless another writer committed first
+        metadata_dict = self._commit(doc_id, document, metadata_dict)
+
+        return [patch["value"] for patch in patches], metadata_dict["version"]
+
+    def _append_node(self, document: dict, parent_path: str, value: Any) -> str:
+        """
+        Append a value to the array at parent_path, modifying the document in place
+
+        Args:
+            document: Document owned by the caller
+            parent_path: JSONPointer to the parent array
+            value: Value to append
+
+        Returns:
+            JSONPointer to the appended element
+
+        Raises:
+            PathNotFoundError: If parent_path doesn't exist
+            ValueError: If parent is not an array
+        """
+        # Navigate to parent node (root needs no pointer resolution)
+        if parent_path in ("", "/"):
+            parent = document
+        else:
+            parent = resolve_pointer(document, parent_path)
 
         # Append/add based on parent type
         if isinstance(parent, list):
-            # Append to array
+            # Append to array; the new element is always the last index
             parent.append(value)
+            created_path = f"{parent_path.rstrip('/')}/{len(parent) - 1}"
         elif isinstance(parent, dict):
             # For dict, value should be a dict with a single key to add
             # But actually, looking at the test, we're appending to an array WITHIN an object
@@ -276,31 +456,62 @@ class DocumentService:
                 f"Parent at {parent_path} must be array or object, got {type(parent).__name__}"
             )
 
-        # Validate the modified document
-        if self._schema_cache:
-            schema = next(iter(self._schema_cache.values()))
-            validation_service = ValidationService(schema)
-            validation_service.validate(document)
+        return created_path
+
+    def create_node(
+        self, doc_id: str, parent_path: str, value: Any, expected_version: int | None = None
+    ) -> tuple[str, int]:
+        """Create a new node by appending to array or adding to object.
 
-        # Convert metadata dict to DocumentMetadata object
-        metadata = DocumentMetadata(**metadata_dict)
+        Args:
+            doc_id: Document identifier
+            parent_path: JSONPointer to parent array or object
+            value: Value to append/add
+            expected_version: Expected document version for optimistic locking, or None
+                to skip the version check
 
-        # Increment version and update timestamp (returns new instance)
-        metadata = metadata.increment_version()
+        Returns:
+            Tuple of (created_path, new_version), where created_path is the
+            JSONPointer to the appended element
 
-        # Store updated document and metadata
-        self.storage.write_document(doc_id, document)
-        self.storage.write_metadata(doc_id, metadata.model_dump(mode="json"))
+        Raises:
+            DocumentNotFoundError: If document doesn't exist
+            PathNotFoundError: If parent_path doesn't exist
+            VersionConflictError: If version doesn't match
+            ValidationFailedError: If result violates schema
+            ValueError: If parent is not array/object
+        """
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
+
+        # Check version for optimistic locking (None opts out of the check)
+        current_version = metadata_dict["version"]
+        if expected_version is not None and current_version != expected_version:
+            raise VersionConflictError(expected=expected_version, actual=current_version)
+
+        # Append to the parent array in place
+        created_path = self._append_node(document, parent_path, value)
 
-        return value, metadata.version
+        # Only the array grew, so validating it covers minItems/maxItems/uniqueItems
+        validation_service = self._validator_for(metadata_dict)
+        if validation_service is not None:
+            validation_service.validate_node(document, parent_path.rstrip("/"))
 
-    def delete_node(self, doc_id: str, node_path: str, expected_version: int) -> tuple[Any, int]:
+        # Store with the incremented version unless another writer committed first
+        metadata_dict = self._commit(doc_id, document, metadata_dict)
+
+        return created_path, metadata_dict["version"]
+
+    def delete_node(
+        self, doc_id: str, node_path: str, expected_version: int | None = None
+    ) -> tuple[Any, int]:
         """Delete a node from document.
 
         Args:
             doc_id: Document identifier
             node_path: JSONPointer to node to delete
-            expected_version: Expected document version for optimistic locking
+            expected_version: Expected document version for optimistic locking, or None
+                to skip the version check
 
         Returns:
             Tuple of (deleted_value, new_version)
@@ -316,47 +527,87 @@ class DocumentService:
         if node_path == "/":
             raise ValueError("Cannot delete root node")
 
-        # Load document from storage
-        try:
-            document = self.storage.read_document(doc_id)
-        except Exception as e:
-            if "not found" in str(e).lower():
-                raise DocumentNotFoundError(doc_id)
-            raise
-
-        # Load metadata
-        metadata_dict = self.storage.read_metadata(doc_id)
-        if metadata_dict is None:
-            raise DocumentNotFoundError(doc_id)
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
 
-        # Check version for optimistic locking
+        # Check version for optimistic locking (None opts out of the check)
         current_version = metadata_dict["version"]
-        if current_version != expected_version:
+        if expected_version is not None and current_version != expected_version:
             raise VersionConflictError(expected=expected_version, actual=current_version)
 
-        # Get the value before deleting it
-        deleted_value = resolve_pointer(document, node_path)
+        # The document was just loaded for this call, so delete in place
+        deleted_value = delete_pointer_inplace(document, node_path)
 
-        # Delete the node using JSONPointer (returns modified copy)
-        document = delete_pointer(document, node_path)
+        # Removing a node only changes its parent (required, minItems, ...)
+        validation_service = self._validator_for(metadata_dict)
+        if validation_service is not None:
+            validation_service.validate_node(document, node_path.rsplit("/", 1)[0])
 
-        # Validate the modified document
-        if self._schema_cache:
-            schema = next(iter(self._schema_cache.values()))
-            validation_service = ValidationService(schema)
-            validation_service.validate(document)
+        # Store with the incremented version unless another writer committed first
+        metadata_dict = self._commit(doc_id, document, metadata_dict)
+
+        return deleted_value, metadata_dict["version"]
 
-        # Convert metadata dict to DocumentMetadata object
-        metadata = DocumentMetadata(**metadata_dict)
+    @contextmanager
+    def batch(self, doc_id: str, expected_version: int | None = None) -> Iterator[DocumentBatch]:
+        """
+        Collect several node mutations and apply them with one load, validation and write
 
-        # Increment version and update timestamp (returns new instance)
-        metadata = metadata.increment_version()
+        The mutations queued on the yielded DocumentBatch are applied in order
+        when the block exits, producing a single version increment. If the block
+        raises, nothing is applied.
 
-        # Store updated document and metadata
-        self.storage.write_document(doc_id, document)
-        self.storage.write_metadata(doc_id, metadata.model_dump(mode="json"))
+        Args:
+            doc_id: The ID of the document to mutate
+            expected_version: Expected version for optimistic locking, or None to skip
+                the version check
 
-        return deleted_value, metadata.version
+        Yields:
+            DocumentBatch to queue update_node/create_node/delete_node calls on; after
+            the block its results hold, per operation, the updated value, created
+            path or deleted value, and version holds the new version
+
+        Raises:
+            DocumentNotFoundError: If document not found
+            VersionConflictError: If expected_version doesn't match current version
+            ValidationFailedError: If the mutated document fails schema validation
+            PathNotFoundError: If a path doesn't exist in document
+            ValueError: If a create targets a non-array parent
+        """
+        batch = DocumentBatch(doc_id)
+        yield batch
+        if not batch.ops:
+            return
+
+        # Load document and metadata from storage
+        document, metadata_dict = self._load_document(doc_id)
+
+        # Check version for optimistic locking (None opts out of the check)
+        current_version = metadata_dict["version"]
+        if expected_version is not None and current_version != expected_version:
+            raise VersionConflictError(expected=expected_version, actual=current_version)
+
+        # Apply every mutation before validating; nothing is saved if any of them fails
+        results = []
+        for op, path, value in batch.ops:
+            if op == "update":
+                set_pointer_inplace(document, path, value)
+                results.append(value)
+            elif op == "create":
+                results.append(self._append_node(document, path, value))
+            else:
+                results.append(delete_pointer_inplace(document, path))
+
+        # Validate the modified document once
+        validation_service = self._validator_for(metadata_dict)
+        if validation_service is not None:
+            validation_service.validate(document)
+
+        # Store with the incremented version unless another writer committed first
+        metadata_dict = self._commit(doc_id, document, metadata_dict)
+
+        batch.results = results
+        batch.version = metadata_dict["version"]
 
     def list_documents(self, limit: int = 100, offset: int = 0) -> list[dict]:
         """List all documents with their metadata.
@@ -371,15 +622,7 @@ class DocumentService:
             - version: Current version number
             - created_at: Creation timestamp (ISO format)
             - updated_at: Last update timestamp (ISO format)
+            - schema_id: Schema the document is validated against
         """
-        # Get document IDs from storage
-        doc_ids = self.storage.list_documents(limit=limit, offset=offset)
-
-        # Load metadata for each document
-        metadata_list = []
-        for doc_id in doc_ids:
-            metadata_dict = self.storage.read_metadata(doc_id)
-            if metadata_dict:
-                metadata_list.append(metadata_dict)
-
-        return metadata_list
+        # Fetch the whole page of metadata in one storage call
+        return self.storage.list_documents_with_metadata(limit=limit, offset=offset)
@@ -2,19 +2,51 @@
 SchemaService - Schema loading and $ref resolution
 """
 
-import copy
+from collections import OrderedDict
+from typing import Any
+
+import orjson
 
 from json_schema_core.domain.errors import ValidationFailedError
+from json_schema_core.services.validation_service import ValidationService
 from json_schema_core.storage.storage_interface import StorageInterface
+from json_schema_core.utils.json_copy import clone_json
+from json_schema_core.utils.json_pointer import resolve_pointer
+
+# Default number of schemas (and compiled validators) kept in memory
+MAX_CACHED_SCHEMAS = 128
+
+# Number of resolved sub-schema nodes kept in memory, across all schemas
+MAX_CACHED_NODES = 1024
+
+# Sentinel for keys missing from a schema while following a local $ref
+_MISSING = object()
+
+# Stack marker for leaving a followed $ref target during resolution
+_LEAVE = object()
 
 
 class SchemaService:
     """Service for loading and resolving JSON schemas"""
 
-    def __init__(self, storage: StorageInterface):
-        """Initialize SchemaService with storage backend"""
+    __slots__ = ("storage", "max_cached_schemas", "_cache", "_validators", "_node_cache")
+
+    def __init__(self, storage: StorageInterface, max_cached_schemas: int = MAX_CACHED_SCHEMAS):
+        """
+        Initialize SchemaService with storage backend
+
+        Args:
+            storage: Storage backend holding the schemas
+            max_cached_schemas: Number of resolved schemas and validators to keep;
+                the least recently used ones are evicted beyond this
+        """
         self.storage = storage
-        self._cache: dict[str, dict] = {}
+        self.max_cached_schemas = max_cached_schemas
+        # Resolved schemas and nodes are cached serialized: parsing hands every caller
+        # its own copy, and bytes are far more compact than the dict tree
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._validators: OrderedDict[str, ValidationService] = OrderedDict()
+        self._node_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
 
     def load_schema(self, schema_id: str) -> dict:
         """
@@ -29,9 +61,11 @@ class SchemaService:
         Raises:
             DocumentNotFoundError: If schema not found in storage
         """
-        # Check cache first
-        if schema_id in self._cache:
-            return copy.deepcopy(self._cache[schema_id])
+        # Check cache first (single lookup on the hit path)
+        cached = self._cache.get(schema_id)
+        if cached is not None:
+            self._cache.move_to_end(schema_id)
+            return orjson.loads(cached)
 
         # Load the base schema
         schema = self.storage.read_document(schema_id)
@@ -39,15 +73,96 @@ class SchemaService:
         # Resolve all $ref references
         resolved = self._resolve_refs(schema, schema_id, set())
 
-        # Cache the resolved schema
-        self._cache[schema_id] = resolved
+        # Cache the resolved schema, evicting the least recently used one if full
+        self._cache[schema_id] = orjson.dumps(resolved)
+        if len(self._cache) > self.max_cached_schemas:
+            evicted_id, _ = self._cache.popitem(last=False)
+            self._drop_nodes(evicted_id)
+
+        # resolved is a fresh copy from _resolve_refs, so the caller can own it
+        return resolved
+
+    def get_schema_node(self, schema_id: str, node_path: str) -> Any:
+        """
+        Get the resolved sub-schema at a JSONPointer path
+
+        Resolved nodes are cached per (schema_id, node_path), so repeated
+        lookups skip both the pointer walk and copying the whole schema. At most
+        MAX_CACHED_NODES are kept; the least recently used ones are evicted.
+
+        Args:
+            schema_id: The ID of the schema to inspect
+            node_path: JSONPointer path within the schema (use "/" for root)
+
+        Returns:
+            A copy of the sub-schema at the given path
+
+        Raises:
+            DocumentNotFoundError: If schema not found in storage
+            PathNotFoundError: If node_path doesn't exist in the schema
+        """
+        key = (schema_id, node_path)
+        cached = self._node_cache.get(key)
+        if cached is not None:
+            self._node_cache.move_to_end(key)
+        else:
+            schema = self.load_schema(schema_id)
+
+            if node_path in ("", "/"):
+                # Root path - the whole schema
+                node = schema
+            else:
+                node = resolve_pointer(schema, node_path)
+            cached = self._node_cache[key] = orjson.dumps(node)
+            if len(self._node_cache) > MAX_CACHED_NODES:
+                self._node_cache.popitem(last=False)
+
+        # Parsing the cached bytes returns a fresh copy
+        return orjson.loads(cached)
 
-        # Return a copy to prevent mutation
-        return copy.deepcopy(resolved)
+    def get_validator(self, schema_id: str) -> ValidationService:
+        """
+        Get the compiled validator for a schema
+
+        The validator is built once per schema ID and reused on later calls,
+        so the schema is only checked and compiled on first use.
+
+        Args:
+            schema_id: The ID of the schema to validate against
+
+        Returns:
+            ValidationService wrapping the fully resolved schema
+
+        Raises:
+            DocumentNotFoundError: If schema not found in storage
+        """
+        validator = self._validators.get(schema_id)
+        if validator is None:
+            validator = ValidationService(self.load_schema(schema_id))
+            self._validators[schema_id] = validator
+            if len(self._validators) > self.max_cached_schemas:
+                self._validators.popitem(last=False)
+        else:
+            self._validators.move_to_end(schema_id)
+        return validator
+
+    def validate(self, schema_id: str, document: dict) -> None:
+        """
+        Validate a document against a schema using the cached validator
+
+        Args:
+            schema_id: The ID of the schema to validate against
+            document: The document to validate
+
+        Raises:
+            ValidationFailedError: If the document fails validation
+            DocumentNotFoundError: If schema not found in storage
+        """
+        self.get_validator(schema_id).validate(document)
 
     def _resolve_refs(self, schema: dict, base_id: str, visited: set[str]) -> dict:
         """
-        Recursively resolve $ref references in a schema
+        Resolve $ref references in a schema
 
         Args:
             schema: The schema (or sub-schema) to resolve
@@ -61,90 +176,135 @@ class SchemaService:
             ValidationFailedError: If circular reference detected
         """
         # Make a copy to avoid mutating the original
-        result = copy.deepcopy(schema)
+        result = clone_json(schema)
 
         # Check for circular reference
         if base_id in visited:
-            raise ValidationFailedError(
-                [
-                    {
-                        "message": f"Circular reference detected: {base_id}",
-                        "path": "",
-                        "validator": "ref_resolution",
-                    }
-                ]
-            )
-
-        visited_copy = visited.copy()
-        visited_copy.add(base_id)
-
-        # Process the schema recursively
-        self._resolve_refs_recursive(result, base_id, visited_copy)
+            raise self._circular_reference_error(base_id)
+
+        # Process the schema in place; the unmodified original serves local refs
+        self._resolve_refs_in_place(result, base_id, visited | {base_id}, {base_id: schema})
 
         return result
 
-    def _resolve_refs_recursive(self, obj: any, base_id: str, visited: set[str]) -> None:
+    def _resolve_refs_in_place(
+        self, root: Any, base_id: str, visited: set[str], schemas: dict[str, dict]
+    ) -> None:
         """
-        Helper to recursively resolve $ref in-place
+        Resolve $ref in-place, walking the schema with an explicit stack
+
+        Each stack entry carries the base schema ID its refs resolve against, so
+        deep schemas don't hit the recursion limit. The refs followed on the way
+        down share one visited set: a target is added when its content is pushed
+        and removed by a marker entry popped once that content is done, so ref
+        cycles (local ones included) are still detected without copying the set.
+        Schemas read from storage and local ref targets are looked up once per
+        call, however often they are referenced, and targets without refs of
+        their own are inlined without being walked again.
 
         Args:
-            obj: Current object being processed (dict, list, or scalar)
+            root: Object to process (dict, list, or scalar)
             base_id: Base schema ID for resolving references
-            visited: Set of visited schema IDs
+            visited: Set of visited schema IDs; updated during the walk and
+                restored when it ends
+            schemas: Unresolved schemas by ID already read from storage; filled
+                in as more are read
         """
-        if isinstance(obj, dict):
-            # Check if this is a $ref
-            if "$ref" in obj:
+        # Ref targets by schema ID or "<schema ID>#/<pointer>", with whether they hold $refs
+        targets: dict[str, tuple[Any, bool]] = {}
+
+        stack = [(root, base_id)]
+        while stack:
+            obj, base_id = stack.pop()
+
+            if obj is _LEAVE:
+                # All content resolved through this target is done
+                visited.remove(base_id)
+                continue
+
+            if isinstance(obj, dict):
+                if "$ref" not in obj:
+                    # Descend into dictionary values
+                    stack.extend((value, base_id) for value in obj.values())
+                    continue
+
                 ref = obj["$ref"]
 
-                # Handle local references (start with #/)
                 if ref.startswith("#/"):
                     # Local reference - resolve within base schema
-                    path = ref[2:].split("/")
-                    base_schema = self.storage.read_document(base_id)
-                    resolved = self._navigate_path(base_schema, path)
-
-                    # Replace $ref with resolved content
-                    obj.clear()
-                    obj.update(copy.deepcopy(resolved))
-
-                    # Continue resolving in the resolved content
-                    self._resolve_refs_recursive(obj, base_id, visited)
+                    target = f"{base_id}{ref}"
+                    ref_base_id = base_id
                 else:
                     # Cross-schema reference - load the referenced schema
-                    ref_id = ref
-
-                    if ref_id in visited:
-                        raise ValidationFailedError(
-                            [
-                                {
-                                    "message": f"Circular reference detected: {ref_id}",
-                                    "path": "",
-                                    "validator": "ref_resolution",
-                                }
-                            ]
-                        )
-
-                    visited_copy = visited.copy()
-                    visited_copy.add(ref_id)
-
-                    ref_schema = self.storage.read_document(ref_id)
-
-                    # Replace $ref with resolved content
-                    obj.clear()
-                    obj.update(copy.deepcopy(ref_schema))
-
-                    # Continue resolving in the resolved content
-                    self._resolve_refs_recursive(obj, ref_id, visited_copy)
-            else:
-                # Recurse into dictionary values
-                for value in obj.values():
-                    self._resolve_refs_recursive(value, base_id, visited)
+                    target = ref
+                    ref_base_id = ref
+
+                if target in visited:
+                    raise self._circular_reference_error(target)
+
+                if target not in targets:
+                    if ref_base_id not in schemas:
+                        schemas[ref_base_id] = self.storage.read_document(ref_base_id)
+                    resolved = schemas[ref_base_id]
+                    if ref.startswith("#/"):
+                        resolved = self._navigate_path(resolved, ref[2:].split("/"))
+                    targets[target] = (resolved, self._contains_ref(resolved))
+                resolved, has_refs = targets[target]
+
+                # Replace $ref with resolved content
+                obj.clear()
+                obj.update(clone_json(resolved))
+
+                # Only content with refs of its own needs walking and cycle tracking
+                if has_refs:
+                    visited.add(target)
+                    stack.append((_LEAVE, target))
+                    stack.append((obj, ref_base_id))
+
+            elif isinstance(obj, list):
+                # Descend into list items
+                stack.extend((item, base_id) for item in obj)
+
+    def _contains_ref(self, obj: Any) -> bool:
+        """
+        Check whether an object contains a $ref anywhere
 
-        elif isinstance(obj, list):
-            # Recurse into list items
-            for item in obj:
-                self._resolve_refs_recursive(item, base_id, visited)
+        Args:
+            obj: Object to inspect (dict, list, or scalar)
+
+        Returns:
+            True if any nested dict has a "$ref" key
+        """
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                if "$ref" in obj:
+                    return True
+                stack.extend(obj.values())
+            elif isinstance(obj, list):
+                stack.extend(obj)
+        return False
+
+    def _circular_reference_error(self, ref: str) -> ValidationFailedError:
+        """
+        Build the error raised when $ref resolution loops back on itself
+
+        Args:
+            ref: The schema ID or local reference seen twice
+
+        Returns:
+            ValidationFailedError describing the cycle
+        """
+        return ValidationFailedError(
+            [
+                {
+                    "message": f"Circular reference detected: {ref}",
+                    "path": "",
+                    "validator": "ref_resolution",
+                }
+            ]
+        )
 
     def _navigate_path(self, obj: any, path: list[str]) -> any:
         """
@@ -162,10 +322,12 @@ class SchemaService:
         """
         current = obj
         for key in path:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                raise ValidationFailedError(f"Cannot resolve reference path: {'/'.join(path)}")
+            # Schemas are parsed JSON, so an exact type check is enough
+            if type(current) is dict:
+                current = current.get(key, _MISSING)
+                if current is not _MISSING:
+                    continue
+            raise ValidationFailedError(f"Cannot resolve reference path: {'/'.join(path)}")
         return current
 
     def get_required_fields(self, schema: dict) -> list[str]:
@@ -218,27 +380,51 @@ class SchemaService:
 
     def _collect_dependencies(self, obj: any, dependencies: set[str]) -> None:
         """
-        Recursively collect schema dependencies from $ref
+        Collect schema dependencies from $ref, walking with an explicit stack
 
         Args:
             obj: Object to scan for $ref
             dependencies: Set to collect dependency IDs into
         """
-        if isinstance(obj, dict):
-            if "$ref" in obj:
-                ref = obj["$ref"]
-                # Only collect external references (not local #/ refs)
-                if not ref.startswith("#/"):
-                    dependencies.add(ref)
-            else:
-                # Recurse into dictionary values
-                for value in obj.values():
-                    self._collect_dependencies(value, dependencies)
-        elif isinstance(obj, list):
-            # Recurse into list items
-            for item in obj:
-                self._collect_dependencies(item, dependencies)
+        stack = [obj]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                if "$ref" in obj:
+                    ref = obj["$ref"]
+                    # Only collect external references (not local #/ refs)
+                    if not ref.startswith("#/"):
+                        dependencies.add(ref)
+                else:
+                    # Descend into dictionary values
+                    stack.extend(obj.values())
+            elif isinstance(obj, list):
+                # Descend into list items
+                stack.extend(obj)
+
+    def invalidate(self, schema_id: str) -> None:
+        """
+        Drop the cached schema and compiled validator for a single schema
+
+        Args:
+            schema_id: The ID of the schema to evict
+        """
+        self._cache.pop(schema_id, None)
+        self._validators.pop(schema_id, None)
+        self._drop_nodes(schema_id)
+
+    def _drop_nodes(self, schema_id: str) -> None:
+        """
+        Drop the cached sub-schema nodes of a single schema
+
+        Args:
+            schema_id: The ID of the schema whose nodes to evict
+        """
+        for key in [key for key in self._node_cache if key[0] == schema_id]:
+            del self._node_cache[key]
 
     def clear_cache(self) -> None:
-        """Clear all cached schemas"""
+        """Clear all cached schemas and validators"""
         self._cache.clear()
+        self._validators.clear()
+        self._node_cache.clear()
@@ -1,11 +1,59 @@
 """Validation service for JSON Schema validation."""
 
-import copy
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
 
 from jsonschema import ValidationError
-from jsonschema import validate as jsonschema_validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from json_schema_core.domain.errors import ValidationFailedError
+from json_schema_core.utils.json_copy import clone_json
+from json_schema_core.utils.json_pointer import parse_pointer
+
+# Keywords that constrain an object or array without looking at the values of its
+# children. Below a schema made only of these, a changed child can be checked
+# against its own sub-schema without revalidating the ancestor.
+_LOCAL_KEYWORDS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$defs",
+        "definitions",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "type",
+        "properties",
+        "additionalProperties",
+        "required",
+        "dependentRequired",
+        "propertyNames",
+        "minProperties",
+        "maxProperties",
+        "items",
+        "minItems",
+        "maxItems",
+    }
+)
+
+# Number of node validators kept per schema; least recently used are evicted
+MAX_CACHED_NODE_VALIDATORS = 256
+
+# Schema path step for an object key that is matched by additionalProperties
+_ANY_KEY = object()
+
+# Marks a defaults plan entry whose property has no default of its own
+_NO_DEFAULT = object()
+
+# Defaults plan: (property name, default or _NO_DEFAULT, nested plan) per property
+_DefaultsPlan = tuple[tuple[str, Any, "_DefaultsPlan"], ...]
 
 
 class ValidationService:
@@ -16,9 +64,28 @@ class ValidationService:
 
         Args:
             schema: JSON Schema dictionary
+
+        Raises:
+            SchemaError: If the schema itself is invalid
         """
         self.schema = schema
 
+        # Compile the validator once; validate() reuses it for every document
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        self._validator = validator_class(schema)
+
+        # LRU of sub-validators by schema path (None = path needs whole-document validation)
+        self._node_validators: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+
+        # Properties apply_defaults visits; empty when the schema has no defaults
+        self._defaults_plan = self._build_defaults_plan(schema)
+
+    @property
+    def has_defaults(self) -> bool:
+        """Whether apply_defaults can change a document for this schema."""
+        return bool(self._defaults_plan)
+
     def validate(self, document: dict) -> None:
         """Validate a document against the schema.
 
@@ -28,31 +95,150 @@ class ValidationService:
         Raises:
             ValidationFailedError: If validation fails, with error details
         """
+        self._raise_for_errors(self._validator.iter_errors(document))
+
+    def validate_node(self, document: dict, pointer: str) -> None:
+        """Validate the node at a JSON Pointer after it changed.
+
+        Assumes the rest of the document was valid before the change. When every
+        ancestor schema constrains its children only through properties, items or
+        additionalProperties, just the node is checked against its sub-schema;
+        otherwise the whole document is validated.
+
+        Args:
+            document: Document containing the changed node
+            pointer: JSON Pointer to the changed node
+
+        Raises:
+            ValidationFailedError: If validation fails, with error details
+        """
+        # Walk the document to learn which keys go through arrays
+        keys = []
+        path = []
+        node = document
         try:
-            jsonschema_validate(instance=document, schema=self.schema)
-        except ValidationError as e:
-            # Collect all validation errors
-            errors = [self._format_error(e)]
+            for key in parse_pointer(pointer):
+                if isinstance(node, list):
+                    index = int(key)
+                    keys.append(None)
+                    path.append(index)
+                    node = node[index]
+                else:
+                    keys.append(key)
+                    path.append(key)
+                    node = node[key]
+        except (ValueError, IndexError, KeyError, TypeError):
+            self.validate(document)
+            return
+
+        validator = self._get_node_validator(keys)
+        if validator is None:
+            self.validate(document)
+            return
 
-            # Check if there are more errors in the context
-            if hasattr(e, "context") and e.context:
-                for sub_error in e.context:
-                    errors.append(self._format_error(sub_error))
+        self._raise_for_errors(validator.iter_errors(node), path)
 
-            raise ValidationFailedError(errors)
+    def _get_node_validator(self, keys: list[str | None]) -> Any:
+        """Get the cached validator for the sub-schema at a node path.
+
+        Args:
+            keys: Object keys along the node path, with None for array items
+
+        Returns:
+            Validator for the sub-schema, or None if an ancestor schema has
+            keywords that depend on child values
+        """
+        # Name each step by the schema it enters, so that all keys matched by
+        # additionalProperties share one cache entry
+        steps = []
+        schema = self.schema
+        for key in keys:
+            if not self._is_local(schema):
+                return None
+            if key is None:
+                steps.append(None)
+                schema = schema.get("items", {})
+            elif key in schema.get("properties", {}):
+                steps.append(key)
+                schema = schema["properties"][key]
+            else:
+                steps.append(_ANY_KEY)
+                schema = schema.get("additionalProperties", {})
+        steps = tuple(steps)
+
+        try:
+            validator = self._node_validators[steps]
+        except KeyError:
+            pass
+        else:
+            self._node_validators.move_to_end(steps)
+            return validator
 
-    def _format_error(self, error: ValidationError) -> dict:
+        # Tuple-form items and nested $id (which moves the ref base) can't be localized
+        if not isinstance(schema, (dict, bool)) or (
+            isinstance(schema, dict) and schema is not self.schema and "$id" in schema
+        ):
+            validator = None
+        else:
+            # evolve() keeps the root resolver, so local $refs still resolve
+            validator = self._validator.evolve(schema=schema)
+
+        self._node_validators[steps] = validator
+        if len(self._node_validators) > MAX_CACHED_NODE_VALIDATORS:
+            self._node_validators.popitem(last=False)
+        return validator
+
+    def _is_local(self, schema: Any) -> bool:
+        """Check whether a schema constrains its children only through their own sub-schemas.
+
+        Args:
+            schema: Ancestor schema on the path to a changed node
+
+        Returns:
+            True if a child change cannot affect this schema's other keywords
+        """
+        if not isinstance(schema, dict) or not schema.keys() <= _LOCAL_KEYWORDS:
+            return False
+        # A nested $id changes the base URI that $refs below it resolve against
+        return schema is self.schema or "$id" not in schema
+
+    def _raise_for_errors(self, errors: Iterable[ValidationError], path: list = ()) -> None:
+        """Raise ValidationFailedError for the most relevant error, if any.
+
+        Args:
+            errors: Errors from a validator's iter_errors
+            path: Location of the validated node within the document
+
+        Raises:
+            ValidationFailedError: If errors is not empty, with error details
+        """
+        e = best_match(errors)
+        if e is None:
+            return
+
+        # Collect all validation errors
+        details = [self._format_error(e, path)]
+
+        # Check if there are more errors in the context
+        if e.context:
+            for sub_error in e.context:
+                details.append(self._format_error(sub_error, path))
+
+        raise ValidationFailedError(details)
+
+    def _format_error(self, error: ValidationError, path: list = ()) -> dict:
         """Format a validation error into a dictionary.
 
         Args:
             error: ValidationError from jsonschema
+            path: Location of the validated node, prepended to the error path
 
         Returns:
             Dictionary with error details
         """
         return {
             "message": error.message,
-            "path": list(error.absolute_path),
+            "path": [*path, *error.absolute_path],
             "validator": error.validator,
             "validator_value": error.validator_value,
         }
@@ -69,33 +255,56 @@ class ValidationService:
             New document with defaults applied
         """
         # Deep copy to avoid modifying original
-        result = copy.deepcopy(document)
+        result = clone_json(document)
 
         # Apply defaults from schema
-        self._apply_defaults_recursive(result, self.schema)
+        self._apply_defaults_recursive(result, self._defaults_plan)
 
         return result
 
-    def _apply_defaults_recursive(self, document: dict, schema: dict) -> None:
-        """Recursively apply defaults from schema to document.
+    def _apply_defaults_recursive(self, document: dict, plan: _DefaultsPlan) -> None:
+        """Recursively apply defaults from a defaults plan to document.
 
         Modifies document in place.
 
         Args:
             document: Document to apply defaults to
-            schema: Schema containing default values
+            plan: Plan from _build_defaults_plan for the matching schema level
+        """
+        for prop_name, default, nested_plan in plan:
+            if prop_name not in document:
+                if default is not _NO_DEFAULT:
+                    # Apply default value
+                    document[prop_name] = clone_json(default)
+            elif nested_plan and isinstance(document[prop_name], dict):
+                # Recursively apply defaults to nested objects
+                self._apply_defaults_recursive(document[prop_name], nested_plan)
+
+    def _build_defaults_plan(self, schema: Any) -> _DefaultsPlan:
+        """Collect the properties apply_defaults has to visit in a schema.
+
+        Follows the properties / nested object walk of apply_defaults once, keeping
+        only properties that declare a default or lead to one, so applying
+        defaults touches just those instead of the whole schema.
+
+        Args:
+            schema: Schema to inspect
+
+        Returns:
+            Tuple of (property name, default or _NO_DEFAULT, nested plan) entries
         """
         if not isinstance(schema, dict):
-            return
+            return ()
 
-        # Get properties and their defaults
-        properties = schema.get("properties", {})
+        plan = []
+        for prop_name, prop_schema in schema.get("properties", {}).items():
+            if not isinstance(prop_schema, dict):
+                continue
+            default = prop_schema.get("default", _NO_DEFAULT)
+            nested_plan = ()
+            if prop_schema.get("type") == "object":
+                nested_plan = self._build_defaults_plan(prop_schema)
+            if default is not _NO_DEFAULT or nested_plan:
+                plan.append((prop_name, default, nested_plan))
 
-        for prop_name, prop_schema in properties.items():
-            if "default" in prop_schema and prop_name not in document:
-                # Apply default value
-                document[prop_name] = copy.deepcopy(prop_schema["default"])
-            elif prop_name in document and isinstance(prop_schema, dict):
-                # Recursively apply defaults to nested objects
-                if prop_schema.get("type") == "object" and isinstance(document[prop_name], dict):
-                    self._apply_defaults_recursive(document[prop_name], prop_schema)
+        return tuple(plan)
@@ -1,55 +1,123 @@
 """File system storage implementation."""
 
-import json
+import mmap
 import os
+import threading
+import weakref
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from json_schema_core.domain.errors import DocumentNotFoundError
 from json_schema_core.storage.storage_interface import StorageInterface
 
+# Documents at least this large are parsed from a read-only memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+# Flags for temp files: O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Durable writes sync each write through this flag, saving the fsync call; 0 if unsupported
+_DSYNC_FLAG = getattr(os, "O_DSYNC", 0)
+
 
 class FileSystemStorage(StorageInterface):
     """File system based storage implementation with atomic writes and durability."""
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, mmap_threshold: int = MMAP_THRESHOLD, durable: bool = True):
         """Initialize file system storage.
 
         Args:
             base_path: Base directory for storage
+            mmap_threshold: Size in bytes from which documents are read via mmap
+            durable: Whether writes are synced to disk before the rename; without
+                it writes stay atomic but may be lost on power failure
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.mmap_threshold = mmap_threshold
+        self.durable = durable
+        # Per-document locks for cas_write, dropped once no writer holds them
+        self._locks: weakref.WeakValueDictionary[str, threading.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._locks_guard = threading.Lock()
 
-    def write_document(self, doc_id: str, content: dict) -> None:
-        """Write a document with atomic operation and durability guarantee.
+    def _load_json(self, path: Path) -> Any:
+        """Parse a JSON file, mapping it into memory when it is large.
 
-        Uses temp file + rename pattern for atomicity.
-        Calls fsync to ensure data reaches disk.
+        Small files are read in one call; large ones are parsed straight from
+        the page cache without copying them into a Python bytes object first.
 
         Args:
-            doc_id: Document identifier
-            content: Document content as dictionary
+            path: File to parse
+
+        Returns:
+            Parsed JSON content
         """
-        doc_file = self.base_path / f"{doc_id}.json"
-        tmp_file = self.base_path / f"{doc_id}.tmp"
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.mmap_threshold or size == 0:
+                return orjson.loads(f.read())
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
+    def _write_files(self, files: list[tuple[Path, bytes]]) -> None:
+        """Atomically replace files with new contents.
+
+        Every payload is written (and synced to disk when durable, via O_DSYNC
+        where the platform has it, else fsync) to a temp file first, then the
+        temp files are renamed over their targets, so a failed write leaves all
+        targets untouched.
+
+        Args:
+            files: (target path, serialized content) pairs, renamed in order
+        """
+        tmp_files = [target.with_suffix(".tmp") for target, _ in files]
 
         try:
-            # Write to temp file
-            with open(tmp_file, "w") as f:
-                json.dump(content, f, indent=2)
-                f.flush()
-                # Ensure data reaches disk before rename
-                os.fsync(f.fileno())
+            flags = _WRITE_FLAGS | _DSYNC_FLAG if self.durable else _WRITE_FLAGS
+            for tmp_file, (_, data) in zip(tmp_files, files):
+                fd = os.open(tmp_file, flags, 0o644)
+                try:
+                    # Unbuffered: the payload goes to the kernel without a Python-side copy
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view) :]
+                    if self.durable and not _DSYNC_FLAG:
+                        # Ensure data reaches disk before rename
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
 
             # Atomic replace (works on both Windows and POSIX)
-            tmp_file.replace(doc_file)
+            for tmp_file, (target, _) in zip(tmp_files, files):
+                tmp_file.replace(target)
 
         except Exception:
-            # Clean up temp file on any error
-            if tmp_file.exists():
-                tmp_file.unlink()
+            # Clean up temp files on any error
+            for tmp_file in tmp_files:
+                if tmp_file.exists():
+                    tmp_file.unlink()
             raise
 
+    def write_document(self, doc_id: str, content: dict) -> None:
+        """Write a document with atomic operation and durability guarantee.
+
+        Uses temp file + rename pattern for atomicity.
+        Syncs the data to disk before the rename unless durable is off.
+
+        Args:
+            doc_id: Document identifier
+            content: Document content as dictionary
+        """
+        # Serialize before opening so a bad payload never creates the temp file
+        data = orjson.dumps(content)
+        self._write_files([(self.base_path / f"{doc_id}.json", data)])
+
     def read_document(self, doc_id: str) -> dict:
         """Read a document by ID.
 
@@ -62,13 +130,38 @@ class FileSystemStorage(StorageInterface):
         Raises:
             DocumentNotFoundError: If document doesn't exist
         """
-        doc_file = self.base_path / f"{doc_id}.json"
+        try:
+            return self._load_json(self.base_path / f"{doc_id}.json")
+        except FileNotFoundError:
+            raise DocumentNotFoundError(doc_id) from None
+
+    def exists(self, doc_id: str) -> bool:
+        """Check whether a document exists without reading it.
+
+        Args:
+            doc_id: Document identifier
 
-        if not doc_file.exists():
-            raise DocumentNotFoundError(doc_id)
+        Returns:
+            True if the document file exists
+        """
+        return (self.base_path / f"{doc_id}.json").exists()
+
+    def read_document_bytes(self, doc_id: str) -> bytes:
+        """Read a document by ID as the raw JSON stored on disk.
 
-        with open(doc_file, "r") as f:
-            return json.load(f)
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Document content as UTF-8 JSON bytes
+
+        Raises:
+            DocumentNotFoundError: If document doesn't exist
+        """
+        try:
+            return (self.base_path / f"{doc_id}.json").read_bytes()
+        except FileNotFoundError:
+            raise DocumentNotFoundError(doc_id) from None
 
     def delete_document(self, doc_id: str) -> None:
         """Delete a document and its metadata.
@@ -112,6 +205,36 @@ class FileSystemStorage(StorageInterface):
         # Apply pagination
         return doc_ids[offset : offset + limit]
 
+    def list_documents_with_metadata(self, limit: int = 100, offset: int = 0) -> list[dict]:
+        """List document metadata with pagination.
+
+        Scans the directory once and reads only the metadata files of the
+        requested page, without per-document existence checks.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            List of metadata dictionaries, ordered by document ID
+        """
+        with os.scandir(self.base_path) as entries:
+            doc_ids = sorted(
+                entry.name.removesuffix(".meta.json")
+                for entry in entries
+                if entry.name.endswith(".meta.json")
+            )
+
+        metadata_list = []
+        for doc_id in doc_ids[offset : offset + limit]:
+            try:
+                meta_bytes = (self.base_path / f"{doc_id}.meta.json").read_bytes()
+                metadata_list.append(orjson.loads(meta_bytes))
+            except FileNotFoundError:
+                # Deleted between the scan and the read
+                continue
+        return metadata_list
+
     def read_metadata(self, doc_id: str) -> dict | None:
         """Read document metadata.
 
@@ -121,40 +244,99 @@ class FileSystemStorage(StorageInterface):
         Returns:
             Metadata dictionary or None if not found
         """
-        meta_file = self.base_path / f"{doc_id}.meta.json"
-
-        if not meta_file.exists():
+        try:
+            return orjson.loads((self.base_path / f"{doc_id}.meta.json").read_bytes())
+        except FileNotFoundError:
             return None
 
-        with open(meta_file, "r") as f:
-            return json.load(f)
+    def read_document_with_metadata(self, doc_id: str) -> tuple[dict, dict | None]:
+        """Read a document and its metadata in one call.
+
+        Saves a call per document over read_document plus read_metadata.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Tuple of (document content, metadata dictionary or None if not found)
+
+        Raises:
+            DocumentNotFoundError: If document doesn't exist
+        """
+        try:
+            document = self._load_json(self.base_path / f"{doc_id}.json")
+        except FileNotFoundError:
+            raise DocumentNotFoundError(doc_id) from None
+
+        try:
+            metadata = orjson.loads((self.base_path / f"{doc_id}.meta.json").read_bytes())
+        except FileNotFoundError:
+            metadata = None
+
+        return document, metadata
 
     def write_metadata(self, doc_id: str, metadata: dict) -> None:
         """Write document metadata with atomic operation and durability guarantee.
 
         Uses temp file + rename pattern for atomicity.
-        Calls fsync to ensure data reaches disk.
+        Syncs the data to disk before the rename unless durable is off.
 
         Args:
             doc_id: Document identifier
             metadata: Metadata dictionary
         """
-        meta_file = self.base_path / f"{doc_id}.meta.json"
-        tmp_file = self.base_path / f"{doc_id}.meta.tmp"
+        # Serialize before opening so a bad payload never creates the temp file
+        data = orjson.dumps(metadata)
+        self._write_files([(self.base_path / f"{doc_id}.meta.json", data)])
 
-        try:
-            # Write to temp file
-            with open(tmp_file, "w") as f:
-                json.dump(metadata, f, indent=2)
-                f.flush()
-                # Ensure data reaches disk before rename
-                os.fsync(f.fileno())
+    def write_document_and_metadata(self, doc_id: str, content: dict, metadata: dict) -> None:
+        """Write a document and its metadata together.
 
-            # Atomic replace (works on both Windows and POSIX)
-            tmp_file.replace(meta_file)
+        Both payloads are serialized and written to temp files before either
+        target is replaced, so a serialization or write failure leaves the
+        previous document and metadata intact. The metadata is renamed last,
+        so its version never runs ahead of the document on disk.
 
-        except Exception:
-            # Clean up temp file on any error
-            if tmp_file.exists():
-                tmp_file.unlink()
-            raise
+        Args:
+            doc_id: Document identifier
+            content: Document content as dictionary
+            metadata: Metadata dictionary
+        """
+        # Serialize before opening so a bad payload never creates the temp files
+        doc_data = orjson.dumps(content)
+        meta_data = orjson.dumps(metadata)
+        self._write_files(
+            [
+                (self.base_path / f"{doc_id}.json", doc_data),
+                (self.base_path / f"{doc_id}.meta.json", meta_data),
+            ]
+        )
+
+    def cas_write(self, doc_id: str, expected_version: int, content: dict, metadata: dict) -> bool:
+        """Write a document and its metadata only if the stored version is unchanged.
+
+        The version check and the write run under a per-document lock, so two
+        writers in this process can't both commit on the same base version.
+
+        Args:
+            doc_id: Document identifier
+            expected_version: Version the stored metadata must still have
+            content: Document content as dictionary
+            metadata: Metadata dictionary to store
+
+        Returns:
+            True if written, False if the stored version differed or the
+            metadata was missing
+        """
+        with self._locks_guard:
+            lock = self._locks.get(doc_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[doc_id] = lock
+
+        with lock:
+            current = self.read_metadata(doc_id)
+            if current is None or current.get("version") != expected_version:
+                return False
+            self.write_document_and_metadata(doc_id, content, metadata)
+            return True
@@ -2,6 +2,10 @@
 
 from abc import ABC, abstractmethod
 
+import orjson
+
+from json_schema_core.domain.errors import DocumentNotFoundError
+
 
 class StorageInterface(ABC):
     """Abstract base class for storage implementations."""
@@ -74,3 +78,110 @@ class StorageInterface(ABC):
             metadata: Metadata dictionary
         """
         pass
+
+    def write_document_and_metadata(self, doc_id: str, content: dict, metadata: dict) -> None:
+        """Write a document and its metadata together.
+
+        Backends that support multi-key transactions should override this to
+        commit both in one operation; the default calls write_document then
+        write_metadata.
+
+        Args:
+            doc_id: Document identifier
+            content: Document content as dictionary
+            metadata: Metadata dictionary
+        """
+        self.write_document(doc_id, content)
+        self.write_metadata(doc_id, metadata)
+
+    def list_documents_with_metadata(self, limit: int = 100, offset: int = 0) -> list[dict]:
+        """List document metadata with pagination.
+
+        Backends that can fetch a page of metadata in one round-trip should
+        override this; the default reads the metadata of each listed ID.
+
+        Args:
+            limit: Maximum number of results
+            offset: Number of results to skip
+
+        Returns:
+            List of metadata dictionaries, in list_documents order
+        """
+        metadata_list = []
+        for doc_id in self.list_documents(limit=limit, offset=offset):
+            metadata = self.read_metadata(doc_id)
+            if metadata:
+                metadata_list.append(metadata)
+        return metadata_list
+
+    @abstractmethod
+    def cas_write(self, doc_id: str, expected_version: int, content: dict, metadata: dict) -> bool:
+        """Write a document and its metadata only if the stored version is unchanged.
+
+        Implementations must make the compare and the write atomic (a lock, a
+        transaction or a conditional update); a separate read then write would
+        let concurrent updates overwrite each other.
+
+        Args:
+            doc_id: Document identifier
+            expected_version: Version the stored metadata must still have
+            content: Document content as dictionary
+            metadata: Metadata dictionary to store
+
+        Returns:
+            True if written, False if the stored version differed or the
+            metadata was missing
+        """
+        pass
+
+    def exists(self, doc_id: str) -> bool:
+        """Check whether a document exists.
+
+        Backends should override this with a cheaper key lookup; the default
+        reads the whole document.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            True if the document exists
+        """
+        try:
+            self.read_document(doc_id)
+        except DocumentNotFoundError:
+            return False
+        return True
+
+    def read_document_bytes(self, doc_id: str) -> bytes:
+        """Read a document by ID as serialized JSON.
+
+        Backends that keep documents serialized should override this to return
+        the stored bytes without parsing them.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Document content as UTF-8 JSON bytes
+
+        Raises:
+            DocumentNotFoundError: If document doesn't exist
+        """
+        return orjson.dumps(self.read_document(doc_id))
+
+    def read_document_with_metadata(self, doc_id: str) -> tuple[dict, dict | None]:
+        """Read a document and its metadata in one call.
+
+        Backends that can fetch both in a single round-trip should override
+        this; the default calls read_document then read_metadata.
+
+        Args:
+            doc_id: Document identifier
+
+        Returns:
+            Tuple of (document content, metadata dictionary or None if not found)
+
+        Raises:
+            DocumentNotFoundError: If document doesn't exist
+        """
+        return self.read_document(doc_id), self.read_metadata(doc_id)
@@ -0,0 +1,64 @@
+"""Fast deep copies of JSON-shaped data."""
+
+import copy
+from typing import Any
+
+import orjson
+
+# Immutable JSON scalar types, shared rather than copied
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def clone_json(obj: Any) -> Any:
+    """Deep-copy JSON data by serializing and parsing it with orjson.
+
+    The round-trip runs entirely in C and is several times faster than
+    copy.deepcopy on dicts, lists and scalars. Values orjson can't encode
+    (non-string keys, big integers, arbitrary objects) fall back to a
+    type-switched copy, so the result is always an independent copy.
+    orjson writes NaN and infinities as null; when the output has a null,
+    the copy is compared with obj (in C) and a mismatch takes the same
+    fallback, so non-finite floats stay intact.
+
+    Args:
+        obj: JSON-compatible value to copy
+
+    Returns:
+        Deep copy of obj
+
+    Examples:
+        >>> schema = {"type": "object", "required": ["title"]}
+        >>> clone_json(schema) == schema
+        True
+    """
+    try:
+        data = orjson.dumps(obj)
+    except TypeError:
+        return _copy_tree(obj)
+    result = orjson.loads(data)
+    if b"null" in data and result != obj:
+        # A NaN or infinity was written as null
+        return _copy_tree(obj)
+    return result
+
+
+def _copy_tree(obj: Any) -> Any:
+    """Deep-copy dicts and lists, sharing immutable scalars.
+
+    Skips copy.deepcopy's memo and __deepcopy__ dispatch for JSON types and
+    only hands anything else to it.
+
+    Args:
+        obj: Value to copy
+
+    Returns:
+        Deep copy of obj
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {key: _copy_tree(value) for key, value in obj.items()}
+    if cls is list:
+        return [_copy_tree(item) for item in obj]
+    if cls in _SCALARS:
+        return obj
+    return copy.deepcopy(obj)
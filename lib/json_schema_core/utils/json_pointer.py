@@ -3,31 +3,59 @@
 Implements RFC 6901 JSON Pointer specification.
 """
 
-import copy
+import functools
+import sys
 from typing import Any
 
 from json_schema_core.domain.errors import PathNotFoundError
 
+# Parsed pointer: one (key, index) pair per component, see tokenize_pointer
+PointerTokens = tuple[tuple[str, int | None], ...]
 
-def parse_pointer(pointer: str) -> list[str]:
-    """Parse a JSON Pointer into a list of path components.
+# Sentinel for keys missing from an object while walking a pointer
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_pointer(pointer: str) -> tuple[str, ...]:
+    """Parse a JSON Pointer into a tuple of path components.
+
+    Results are cached; the tuple is immutable so it is safe to share.
 
     Args:
         pointer: JSON Pointer string (e.g., "/path/to/field")
 
     Returns:
-        List of path components
+        Tuple of path components
 
     Examples:
         >>> parse_pointer("/title")
-        ["title"]
+        ("title",)
         >>> parse_pointer("/sections/0/title")
-        ["sections", "0", "title"]
+        ("sections", "0", "title")
         >>> parse_pointer("")
-        []
+        ()
+    """
+    return tuple(key for key, _ in tokenize_pointer(pointer))
+
+
+@functools.lru_cache(maxsize=4096)
+def tokenize_pointer(pointer: str) -> PointerTokens:
+    """Parse a JSON Pointer into cached (key, index) tokens.
+
+    Keys are interned. The index is the component pre-converted to int for
+    array access, or None when the component is not a plain decimal number. The result can
+    be passed to resolve_pointer, set_pointer_inplace and delete_pointer_inplace
+    in place of the string, so a path used several times is parsed once.
+
+    Args:
+        pointer: JSON Pointer string
+
+    Returns:
+        Tuple of (key, index) pairs, one per path component
     """
     if pointer == "":
-        return []
+        return ()
 
     if not pointer.startswith("/"):
         raise ValueError(f"JSON Pointer must start with '/': {pointer}")
@@ -35,76 +63,171 @@ def parse_pointer(pointer: str) -> list[str]:
     # Remove leading slash and split
     parts = pointer[1:].split("/")
 
-    # Unescape special characters per RFC 6901
+    # Unescape special characters per RFC 6901, only in components that have any
     # ~1 represents / and ~0 represents ~
-    unescaped = []
+    tokens = []
     for part in parts:
-        part = part.replace("~1", "/")
-        part = part.replace("~0", "~")
-        unescaped.append(part)
+        if "~" in part:
+            part = part.replace("~1", "/").replace("~0", "~")
+        # Interned once here; cached tokens then share one object per segment name
+        part = sys.intern(part)
+        # Only plain ASCII digits index arrays; int() would also take "+1", " 1" or "1_0"
+        index = int(part) if part.isascii() and part.isdigit() else None
+        tokens.append((part, index))
 
-    return unescaped
+    return tuple(tokens)
 
 
-def resolve_pointer(document: dict, pointer: str) -> Any:
-    """Resolve a JSON Pointer to get the value at that path.
+def _tokens(pointer: str | PointerTokens) -> PointerTokens:
+    """Get the tokens for a pointer given as a string or already tokenized.
 
     Args:
-        document: JSON document to navigate
-        pointer: JSON Pointer string
+        pointer: JSON Pointer string or tokens from tokenize_pointer
 
     Returns:
-        Value at the pointer location
+        Parsed pointer tokens
+    """
+    return tokenize_pointer(pointer) if isinstance(pointer, str) else pointer
 
-    Raises:
-        PathNotFoundError: If the path doesn't exist, with detailed context
 
-    Examples:
-        >>> doc = {"title": "Test", "value": 42}
-        >>> resolve_pointer(doc, "/title")
-        "Test"
-        >>> resolve_pointer(doc, "/value")
-        42
+def _not_found(pointer: str | PointerTokens, segment: str) -> PathNotFoundError:
+    """Build the error for a missing path, formatting tokens back into a pointer.
+
+    Args:
+        pointer: JSON Pointer string or tokens from tokenize_pointer
+        segment: Unescaped component the walk could not follow
+
+    Returns:
+        PathNotFoundError carrying the pointer string and failing segment
     """
-    parts = parse_pointer(pointer)
+    if not isinstance(pointer, str):
+        pointer = "".join("/" + key.replace("~", "~0").replace("/", "~1") for key, _ in pointer)
+    return PathNotFoundError(pointer, segment)
 
-    # Root pointer returns whole document
-    if not parts:
-        return document
 
+def _list_index(array: list, key: str, index: int | None, pointer: str | PointerTokens) -> int:
+    """Check a token's array index against an array.
+
+    Args:
+        array: Array being indexed
+        key: Component the index was parsed from, used for error reporting
+        index: Index from tokenize_pointer, None for non-numeric components
+        pointer: Original pointer, used for error reporting
+
+    Returns:
+        The index, known to be within the array
+
+    Raises:
+        PathNotFoundError: If the component is not an index into the array
+    """
+    if index is None or index >= len(array):
+        raise _not_found(pointer, key)
+    return index
+
+
+def _walk(document: Any, tokens: PointerTokens, pointer: str | PointerTokens) -> Any:
+    """Follow parsed pointer tokens from document down to the target value.
+
+    Args:
+        document: JSON document to navigate
+        tokens: Parsed tokens from tokenize_pointer
+        pointer: Original pointer, used for error reporting
+
+    Returns:
+        Value at the end of the token path
+
+    Raises:
+        PathNotFoundError: If any component doesn't exist
+    """
     current = document
-    current_path = ""
 
-    for i, part in enumerate(parts):
-        current_path += f"/{part}"
+    for key, index in tokens:
+        # Handle dictionary access, with a single lookup per step
+        if isinstance(current, dict):
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                raise _not_found(pointer, key)
 
         # Handle array indexing
-        if isinstance(current, list):
-            try:
-                index = int(part)
-                if index < 0 or index >= len(current):
-                    raise PathNotFoundError(pointer)
-                current = current[index]
-            except (ValueError, IndexError):
-                raise PathNotFoundError(pointer)
-
-        # Handle dictionary access
-        elif isinstance(current, dict):
-            if part not in current:
-                raise PathNotFoundError(pointer)
-            current = current[part]
+        elif isinstance(current, list):
+            current = current[_list_index(current, key, index, pointer)]
 
         # Can't navigate further into non-container types
         else:
-            raise PathNotFoundError(pointer)
+            raise _not_found(pointer, key)
 
     return current
 
 
+def _copy_path(document: Any, tokens: PointerTokens, pointer: str) -> Any:
+    """Shallow-copy the containers from document down to the target's parent.
+
+    Siblings off the path keep their identity, so a change below the copied
+    parent costs O(depth) instead of a copy of the whole document.
+
+    Args:
+        document: JSON document to copy
+        tokens: Parsed tokens from tokenize_pointer
+        pointer: Original pointer, used for error reporting
+
+    Returns:
+        Copy of document whose containers along the path are fresh copies
+
+    Raises:
+        PathNotFoundError: If an intermediate component doesn't exist
+    """
+    result = current = document.copy()
+
+    for key, index in tokens[:-1]:
+        if isinstance(current, dict):
+            child = current.get(key, _MISSING)
+            if child is _MISSING:
+                raise _not_found(pointer, key)
+            slot = key
+        elif isinstance(current, list):
+            slot = _list_index(current, key, index, pointer)
+            child = current[slot]
+        else:
+            raise _not_found(pointer, key)
+
+        # Scalars are left alone; the in-place step then reports the bad path
+        if isinstance(child, (dict, list)):
+            child = child.copy()
+            current[slot] = child
+        current = child
+
+    return result
+
+
+def resolve_pointer(document: dict, pointer: str | PointerTokens) -> Any:
+    """Resolve a JSON Pointer to get the value at that path.
+
+    Args:
+        document: JSON document to navigate
+        pointer: JSON Pointer string, or tokens from tokenize_pointer
+
+    Returns:
+        Value at the pointer location
+
+    Raises:
+        PathNotFoundError: If the path doesn't exist, with detailed context
+
+    Examples:
+        >>> doc = {"title": "Test", "value": 42}
+        >>> resolve_pointer(doc, "/title")
+        "Test"
+        >>> resolve_pointer(doc, "/value")
+        42
+    """
+    return _walk(document, _tokens(pointer), pointer)
+
+
 def set_pointer(document: dict, pointer: str, value: Any) -> dict:
     """Set a value at a JSON Pointer location.
 
     Creates a new document with the value set. Does NOT modify the original.
+    Only the containers along the path are copied; untouched subtrees are
+    shared with the original, so neither should be mutated in place afterwards.
     Does NOT auto-create intermediate paths - all parent paths must exist.
 
     Args:
@@ -125,56 +248,56 @@ def set_pointer(document: dict, pointer: str, value: Any) -> dict:
         >>> set_pointer(doc, "/nested/field", "new")
         {"title": "Test", "nested": {"field": "new"}}
     """
-    parts = parse_pointer(pointer)
+    tokens = tokenize_pointer(pointer)
 
-    if not parts:
+    if not tokens:
         raise ValueError("Cannot set root pointer")
 
-    # Deep copy to avoid modifying original
-    result = copy.deepcopy(document)
+    # Copy just the path to avoid modifying original
+    result = _copy_path(document, tokens, pointer)
+    set_pointer_inplace(result, tokens, value)
+    return result
 
-    # Navigate to parent
-    current = result
-    for i, part in enumerate(parts[:-1]):
-        if isinstance(current, list):
-            try:
-                index = int(part)
-                if index < 0 or index >= len(current):
-                    raise PathNotFoundError(pointer)
-                current = current[index]
-            except (ValueError, IndexError):
-                raise PathNotFoundError(pointer)
-        elif isinstance(current, dict):
-            if part not in current:
-                # NO auto-creation - path must exist
-                raise PathNotFoundError(pointer)
-            current = current[part]
-        else:
-            raise PathNotFoundError(pointer)
+
+def set_pointer_inplace(document: dict, pointer: str | PointerTokens, value: Any) -> None:
+    """Set a value at a JSON Pointer location, modifying the document in place.
+
+    Only walks the path; use it when the caller owns the document. Like
+    set_pointer, intermediate paths must exist but the final key may be new.
+
+    Args:
+        document: JSON document to modify
+        pointer: JSON Pointer string, or tokens from tokenize_pointer
+        value: Value to set
+
+    Raises:
+        PathNotFoundError: If the path doesn't exist (no auto-creation)
+    """
+    tokens = _tokens(pointer)
+
+    if not tokens:
+        raise ValueError("Cannot set root pointer")
+
+    # Navigate to parent (NO auto-creation - path must exist)
+    parent = _walk(document, tokens[:-1], pointer)
 
     # Set the final value
-    final_part = parts[-1]
-    if isinstance(current, list):
-        try:
-            index = int(final_part)
-            if index < 0 or index >= len(current):
-                raise PathNotFoundError(pointer)
-            current[index] = value
-        except (ValueError, IndexError):
-            raise PathNotFoundError(pointer)
-    elif isinstance(current, dict):
+    key, index = tokens[-1]
+    if isinstance(parent, list):
+        parent[_list_index(parent, key, index, pointer)] = value
+    elif isinstance(parent, dict):
         # For set, we allow creating the final key
-        current[final_part] = value
+        parent[key] = value
     else:
-        raise PathNotFoundError(pointer)
-
-    return result
+        raise _not_found(pointer, key)
 
 
 def delete_pointer(document: dict, pointer: str) -> dict:
     """Delete a value at a JSON Pointer location.
 
     Creates a new document with the value deleted. Does NOT modify the original.
+    Only the containers along the path are copied; untouched subtrees are
+    shared with the original, so neither should be mutated in place afterwards.
 
     Args:
         document: JSON document to modify
@@ -191,47 +314,46 @@ def delete_pointer(document: dict, pointer: str) -> dict:
         >>> delete_pointer(doc, "/value")
         {"title": "Test"}
     """
-    parts = parse_pointer(pointer)
+    tokens = tokenize_pointer(pointer)
 
-    if not parts:
+    if not tokens:
         raise ValueError("Cannot delete root pointer")
 
-    # Deep copy to avoid modifying original
-    result = copy.deepcopy(document)
+    # Copy just the path to avoid modifying original
+    result = _copy_path(document, tokens, pointer)
+    delete_pointer_inplace(result, tokens)
+    return result
+
+
+def delete_pointer_inplace(document: dict, pointer: str | PointerTokens) -> Any:
+    """Delete a value at a JSON Pointer location, modifying the document in place.
+
+    Args:
+        document: JSON document to modify
+        pointer: JSON Pointer string, or tokens from tokenize_pointer
+
+    Returns:
+        The deleted value
+
+    Raises:
+        PathNotFoundError: If the path doesn't exist
+    """
+    tokens = _tokens(pointer)
+
+    if not tokens:
+        raise ValueError("Cannot delete root pointer")
 
     # Navigate to parent
-    current = result
-    for i, part in enumerate(parts[:-1]):
-        if isinstance(current, list):
-            try:
-                index = int(part)
-                if index < 0 or index >= len(current):
-                    raise PathNotFoundError(pointer)
-                current = current[index]
-            except (ValueError, IndexError):
-                raise PathNotFoundError(pointer)
-        elif isinstance(current, dict):
-            if part not in current:
-                raise PathNotFoundError(pointer)
-            current = current[part]
-        else:
-            raise PathNotFoundError(pointer)
+    parent = _walk(document, tokens[:-1], pointer)
 
     # Delete the final value
-    final_part = parts[-1]
-    if isinstance(current, list):
-        try:
-            index = int(final_part)
-            if index < 0 or index >= len(current):
-                raise PathNotFoundError(pointer)
-            del current[index]
-        except (ValueError, IndexError):
-            raise PathNotFoundError(pointer)
-    elif isinstance(current, dict):
-        if final_part not in current:
-            raise PathNotFoundError(pointer)
-        del current[final_part]
+    key, index = tokens[-1]
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, key, index, pointer))
+    elif isinstance(parent, dict):
+        value = parent.pop(key, _MISSING)
+        if value is _MISSING:
+            raise _not_found(pointer, key)
+        return value
     else:
-        raise PathNotFoundError(pointer)
-
-    return result
+        raise _not_found(pointer, key)
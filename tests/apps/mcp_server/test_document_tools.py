@@ -100,6 +100,33 @@ def test_document_read_node_nested(mcp_server, sample_schema):
     assert result["content"] == []
 
 
+def test_document_read_node_raw(mcp_server, sample_schema):
+    """Test document_read_node returns the stored JSON unparsed for raw root reads."""
+    import orjson
+
+    from apps.mcp_server.responses import RawJSON, encode_response
+    from apps.mcp_server.tools.document_tools import document_create, document_read_node
+
+    create_result = document_create(mcp_server, sample_schema)
+    doc_id = create_result["doc_id"]
+
+    result = document_read_node(doc_id=doc_id, node_path="/", raw=True, server=mcp_server)
+    parsed = document_read_node(doc_id=doc_id, node_path="/", server=mcp_server)
+
+    assert isinstance(result["content"], RawJSON)
+    assert result["version"] == 1
+    assert orjson.loads(encode_response(result)) == parsed
+
+
+def test_document_read_node_raw_not_found(mcp_server):
+    """Test raw root reads still report missing documents."""
+    from apps.mcp_server.tools.document_tools import document_read_node
+
+    result = document_read_node(doc_id="nonexistent", node_path="/", raw=True, server=mcp_server)
+
+    assert result["error"] == "document-not-found"
+
+
 def test_document_read_node_not_found(mcp_server):
     """Test document_read_node returns error for non-existent document."""
     from apps.mcp_server.tools.document_tools import document_read_node
@@ -188,7 +215,19 @@ def test_document_update_node_version_conflict(mcp_server, sample_schema):
     assert "error" in result
     assert result["error"] == "version-conflict"
     assert result["expected"] == 1
-    # actual version should be 2
+    assert result["actual"] == 2
+
+
+def test_document_update_node_not_found(mcp_server):
+    """Test document_update_node returns error for non-existent document."""
+    from apps.mcp_server.tools.document_tools import document_update_node
+
+    result = document_update_node(
+        doc_id="nonexistent", node_path="/title", value="x", expected_version=1, server=mcp_server
+    )
+
+    assert result["error"] == "document-not-found"
+    assert result["doc_id"] == "nonexistent"
 
 
 def test_document_update_node_validation_error(mcp_server, sample_schema):
@@ -209,6 +248,35 @@ def test_document_update_node_validation_error(mcp_server, sample_schema):
     assert result["error"] == "validation-failed"
 
 
+def test_document_update_nodes_success(mcp_server, sample_schema):
+    """Test document_update_nodes applies several updates in one version."""
+    from apps.mcp_server.tools.document_tools import (
+        document_create,
+        document_read_node,
+        document_update_nodes,
+    )
+
+    create_result = document_create(mcp_server, sample_schema)
+    doc_id = create_result["doc_id"]
+
+    result = document_update_nodes(
+        doc_id=doc_id,
+        patches=[
+            {"path": "/title", "value": "New Title"},
+            {"path": "/content", "value": "Body"},
+        ],
+        expected_version=1,
+        server=mcp_server,
+    )
+
+    assert result["contents"] == ["New Title", "Body"]
+    assert result["version"] == 2
+
+    read_result = document_read_node(doc_id=doc_id, node_path="/", server=mcp_server)
+    assert read_result["content"]["title"] == "New Title"
+    assert read_result["content"]["content"] == "Body"
+
+
 def test_document_create_node_success(mcp_server, sample_schema):
     """Test document_create_node tool creates a new node in an array."""
     from apps.mcp_server.tools.document_tools import (
@@ -374,3 +442,22 @@ def test_document_list_pagination(mcp_server, sample_schema):
 
 
 
+
+
+def test_mcp_errors_maps_subclasses_of_domain_errors():
+    """Test that subclasses of mapped errors get their base class's error response."""
+    from json_schema_core.domain.errors import DocumentNotFoundError
+
+    from apps.mcp_server.tools.document_tools import mcp_errors
+
+    class ArchivedDocumentError(DocumentNotFoundError):
+        pass
+
+    @mcp_errors("read-failed")
+    def failing_tool():
+        raise ArchivedDocumentError("doc-1")
+
+    result = failing_tool()
+
+    assert result["error"] == "document-not-found"
+    assert result["doc_id"] == "doc-1"
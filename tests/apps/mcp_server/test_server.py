@@ -1,5 +1,7 @@
 """Tests for MCP server initialization."""
 
+import orjson
+import pytest
 
 
 def test_server_creation(document_service):
@@ -21,8 +23,96 @@ def test_server_has_services(mcp_server):
     assert isinstance(mcp_server.document_service, DocumentService)
 
 
-def test_server_registers_tools(mcp_server):
+async def test_server_registers_tools(mcp_server):
     """Test that server registers MCP tools."""
-    # For now, just check that the server has a list_tools method
-    # We'll verify specific tools once they're implemented
-    assert hasattr(mcp_server.server, "list_tools")
+    from mcp import types
+
+    from apps.mcp_server.tools import TOOLS
+
+    handler = mcp_server.server.request_handlers[types.ListToolsRequest]
+    result = await handler(types.ListToolsRequest(method="tools/list"))
+    tools = {tool.name: tool for tool in result.root.tools}
+
+    assert set(tools) == set(TOOLS)
+    assert tools["document_read_node"].inputSchema["required"] == ["doc_id", "node_path"]
+    assert "server" not in tools["document_read_node"].inputSchema["properties"]
+
+    properties = tools["document_update_node"].inputSchema["properties"]
+    assert properties["doc_id"] == {"type": "string", "description": "Document ID"}
+    assert properties["expected_version"]["type"] == ["integer", "null"]
+    assert properties["value"] == {"description": "New value for the node"}
+    assert tools["document_update_nodes"].inputSchema["properties"]["patches"]["type"] == "array"
+
+
+async def test_server_call_tool_handler(mcp_server, sample_schema):
+    """Test that MCP call_tool requests are dispatched through call_tool."""
+    from mcp import types
+
+    handler = mcp_server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(
+            name="document_create", arguments={"schema_id": sample_schema}
+        ),
+    )
+    result = await handler(request)
+
+    assert result.root.isError is False
+    assert orjson.loads(result.root.content[0].text)["version"] == 1
+
+
+async def test_server_call_tool_handler_raw(mcp_server, sample_schema):
+    """Test that RawJSON tool responses are encoded by the call_tool handler."""
+    from mcp import types
+
+    doc_id = mcp_server.call_tool("document_create", {"schema_id": sample_schema})["doc_id"]
+    handler = mcp_server.server.request_handlers[types.CallToolRequest]
+    request = types.CallToolRequest(
+        method="tools/call",
+        params=types.CallToolRequestParams(
+            name="document_read_node", arguments={"doc_id": doc_id, "node_path": "", "raw": True}
+        ),
+    )
+    result = await handler(request)
+
+    assert result.root.isError is False
+    response = orjson.loads(result.root.content[0].text)
+    assert response["content"]["title"] == "Untitled"
+    assert response["version"] == 1
+
+
+def test_tools_use_active_server(mcp_server, sample_schema):
+    """Test that tools fall back to the server set by MCPServer.activate()."""
+    from apps.mcp_server.tools.document_tools import document_create, document_read_node
+
+    with mcp_server.activate():
+        create_result = document_create(None, sample_schema)
+        result = document_read_node(doc_id=create_result["doc_id"], node_path="/title")
+
+    assert result["content"] == "Untitled"
+    assert result["version"] == 1
+
+
+def test_current_server_outside_activate():
+    """Test that current_server raises when no server is active."""
+    from apps.mcp_server.context import current_server
+
+    with pytest.raises(RuntimeError):
+        current_server()
+
+
+def test_call_tool_dispatches_by_name(mcp_server, sample_schema):
+    """Test that call_tool looks up the tool and runs it with the server active."""
+    create_result = mcp_server.call_tool("document_create", {"schema_id": sample_schema})
+    result = mcp_server.call_tool(
+        "document_read_node", {"doc_id": create_result["doc_id"], "node_path": "/title"}
+    )
+
+    assert result == {"content": "Untitled", "version": 1}
+
+
+def test_call_tool_unknown_name(mcp_server):
+    """Test that call_tool reports unknown tool names."""
+    result = mcp_server.call_tool("no_such_tool", {})
+
+    assert result["error"] == "unknown-tool"
@@ -21,6 +21,14 @@ def test_document_id_generate():
     assert str(doc_id) != str(doc_id2)
 
 
+def test_document_id_generate_mono_is_ordered():
+    """Test that generate_mono returns valid, strictly increasing ids."""
+    ids = [DocumentId.generate_mono() for _ in range(100)]
+
+    assert all(DocumentId.is_valid(doc_id) for doc_id in ids)
+    assert ids == sorted(set(ids))
+
+
 def test_document_id_str_conversion():
     """Test converting DocumentId to string."""
     ulid_str = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
@@ -30,3 +38,36 @@ def test_document_id_str_conversion():
     result = str(doc_id)
     assert result == ulid_str
     assert isinstance(result, str)
+
+
+def test_document_id_is_str():
+    """Test that DocumentId can be used directly as a string."""
+    ulid_str = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+    doc_id = DocumentId(ulid_str)
+
+    assert isinstance(doc_id, str)
+    assert doc_id == ulid_str
+    assert f"{doc_id}.json" == f"{ulid_str}.json"
+
+
+def test_document_id_bytes_round_trip():
+    """Test converting DocumentId to and from its 16-byte ULID form."""
+    doc_id = DocumentId.generate()
+
+    data = doc_id.to_bytes()
+
+    assert len(data) == 16
+    assert DocumentId.from_bytes(data) == doc_id
+
+
+def test_document_id_is_valid():
+    """Test that is_valid accepts canonical ULIDs and rejects anything else."""
+    assert DocumentId.is_valid("01ARZ3NDEKTSV4RRFFQ69G5FAV")
+    assert DocumentId.is_valid(DocumentId.generate())
+
+    assert not DocumentId.is_valid("01arz3ndektsv4rrffq69g5fav")  # lowercase
+    assert not DocumentId.is_valid("01ARZ3NDEKTSV4RRFFQ69G5FA")  # too short
+    assert not DocumentId.is_valid("01ARZ3NDEKTSV4RRFFQ69G5FAVX")  # too long
+    assert not DocumentId.is_valid("01ARZ3NDEKTSV4RRFFQ69G5FAI")  # I is not base32
+    assert not DocumentId.is_valid("81ARZ3NDEKTSV4RRFFQ69G5FAV")  # timestamp overflow
+    assert not DocumentId.is_valid("０1ARZ3NDEKTSV4RRFFQ69G5FAV")  # non-ASCII digit
@@ -19,6 +19,17 @@ def test_path_not_found_error():
     error = exc_info.value
     assert error.path == path
     assert path in str(error)
+    assert error.segment is None
+
+
+def test_path_not_found_error_segment():
+    """Test PathNotFoundError reports the component that couldn't be followed."""
+    error = PathNotFoundError("/a/b/c", "b")
+
+    assert error.path == "/a/b/c"
+    assert error.segment == "b"
+    assert "/a/b/c" in str(error)
+    assert "'b'" in str(error)
 
 
 def test_version_conflict_error():
@@ -32,6 +43,7 @@ def test_version_conflict_error():
     error = exc_info.value
     assert error.expected == expected
     assert error.actual == actual
+    assert error.actual_version == actual
     assert str(expected) in str(error)
     assert str(actual) in str(error)
 
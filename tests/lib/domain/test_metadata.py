@@ -1,7 +1,9 @@
 """Tests for DocumentMetadata value object."""
 
+import dataclasses
 from datetime import datetime
 
+import pytest
 from json_schema_core.domain.metadata import DocumentMetadata
 
 
@@ -87,3 +89,45 @@ def test_metadata_increment_version():
 
     # Original should be unchanged
     assert metadata.version == 1
+
+
+def test_metadata_is_immutable():
+    """Test that DocumentMetadata fields cannot be reassigned."""
+    metadata = DocumentMetadata(
+        doc_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+        version=1,
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        metadata.version = 2
+
+
+def test_metadata_dict_round_trip():
+    """Test that to_dict output is accepted by from_dict."""
+    metadata = DocumentMetadata(
+        doc_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+        version=4,
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 2, 15, 30, 0, 123456),
+        schema_id="text",
+    )
+
+    assert DocumentMetadata.from_dict(metadata.to_dict()) == metadata
+
+
+def test_metadata_increment_version_with_timestamp():
+    """Test that increment_version records a caller-supplied timestamp."""
+    metadata = DocumentMetadata(
+        doc_id="01ARZ3NDEKTSV4RRFFQ69G5FAV",
+        version=1,
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    now = datetime(2024, 3, 1, 9, 0, 0)
+
+    new_metadata = metadata.increment_version(now)
+
+    assert new_metadata.version == 2
+    assert new_metadata.updated_at == now
@@ -2,12 +2,10 @@
 Tests for DocumentService - Document CRUD operations
 """
 
-import json
-import shutil
-import tempfile
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 import pytest
 from json_schema_core.domain.document_id import DocumentId
 from json_schema_core.domain.errors import ValidationFailedError, VersionConflictError
@@ -17,29 +15,26 @@ from json_schema_core.services.schema_service import SchemaService
 from json_schema_core.services.validation_service import ValidationService
 from json_schema_core.storage.file_storage import FileSystemStorage
 
+TEXT_SCHEMA_PATH = Path(__file__).parent.parent.parent.parent / "schemas" / "text.json"
+
 # P1.0.1: Test Fixtures for DocumentService
 
 
 @pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory"""
-    temp_dir = tempfile.mkdtemp()
-    storage = FileSystemStorage(temp_dir)
-    yield storage
-    shutil.rmtree(temp_dir)
+def temp_storage(tmp_path):
+    """Create storage in a temporary directory, skipping fsync (durability isn't under test)"""
+    return FileSystemStorage(tmp_path, durable=False)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def text_schema():
-    """Load and return the text.json schema"""
-    schema_path = Path(__file__).parent.parent.parent.parent / "schemas" / "text.json"
-    with open(schema_path, "r") as f:
-        return json.load(f)
+    """Load and return the text.json schema (read-only, shared by all tests)"""
+    return orjson.loads(TEXT_SCHEMA_PATH.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validation_service(text_schema):
-    """Create a ValidationService with text schema"""
+    """Create a ValidationService with text schema, compiled once per session"""
     return ValidationService(text_schema)
 
 
@@ -152,9 +147,16 @@ def test_create_document_validation_failure(document_service, sample_schema):
         "sections": [],
     }
 
-    with pytest.raises(ValidationFailedError):
+    with pytest.raises(ValidationFailedError) as exc_info:
         document_service.create_document(schema_id, invalid_document)
 
+    # Verify error contains validation details
+    error = exc_info.value
+    assert len(error.errors) > 0
+    # Check if any error mentions the validation issue
+    error_str = str(error.errors).lower()
+    assert "authors" in error_str or "minitems" in error_str or "too short" in error_str
+
 
 def test_create_document_metadata_correct(document_service, sample_schema):
     """Test that metadata is created correctly"""
@@ -204,6 +206,51 @@ def test_create_document_atomic_storage(document_service, sample_schema, temp_st
     assert stored_meta["version"] == 1
 
 
+def test_create_document_reuses_validator(document_service, sample_schema, valid_minimal_doc):
+    """Test that the compiled validator is cached per schema_id across creates"""
+    schema_id, _ = sample_schema
+    metadata = {"schema_id": schema_id}
+
+    document_service.create_document(schema_id, valid_minimal_doc)
+    validator = document_service._validator_for(metadata)
+    document_service.create_document(schema_id, valid_minimal_doc)
+
+    assert document_service._validator_for(metadata) is validator
+
+    # Invalidation drops it so the next create recompiles
+    document_service.invalidate_schema(schema_id)
+    recompiled = document_service._validator_for(metadata)
+    assert recompiled is not validator
+
+    # SchemaService is the only cache, so invalidating it directly is seen too
+    document_service.schema_service.invalidate(schema_id)
+    assert document_service._validator_for(metadata) is not recompiled
+
+
+def test_create_document_repeat_skips_validation(
+    document_service, sample_schema, valid_minimal_doc, monkeypatch
+):
+    """Test that creating the same content again reuses the earlier validation result"""
+    schema_id, _ = sample_schema
+    validator = document_service.schema_service.get_validator(schema_id)
+    calls = []
+    original = validator.validate
+    monkeypatch.setattr(validator, "validate", lambda doc: calls.append(doc) or original(doc))
+
+    first_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+    second_id, _ = document_service.create_document(schema_id, dict(valid_minimal_doc))
+
+    # Both documents are stored, but only the first was validated
+    assert first_id != second_id
+    assert len(calls) == 1
+
+    # Invalid documents are never remembered
+    for _ in range(2):
+        with pytest.raises(ValidationFailedError):
+            document_service.create_document(schema_id, {"title": 1})
+    assert len(calls) == 3
+
+
 # P1.1.2: Document Creation with Custom ID
 
 
@@ -240,9 +287,10 @@ def test_create_document_custom_id_already_exists(document_service, sample_schem
         document_service.create_document(schema_id, document2, doc_id=custom_id)
 
 
-def test_create_document_custom_id_must_be_valid(document_service, sample_schema):
-    """Test that custom ID must be valid format"""
-    schema_id, _ = sample_schema
+def test_create_document_custom_id_must_be_valid(document_service):
+    """Test that custom ID must be valid format, checked before the schema is loaded"""
+    # The schema is never stored: the ID check must reject the call first
+    schema_id = str(DocumentId.generate())
     document = {"title": "Test", "authors": ["Test Author"], "sections": []}
 
     # Try with invalid ID (not ULID format)
@@ -312,28 +360,6 @@ def test_create_document_validates_after_defaults(document_service, temp_storage
     assert stored_doc["name"] == "Test"
 
 
-def test_create_document_empty_required_array(document_service, sample_schema):
-    """Test that empty array for required field with minItems fails validation"""
-    schema_id, _ = sample_schema
-
-    # text.json schema requires authors array to have minItems: 1
-    document = {
-        "title": "Test",
-        "authors": [],  # Empty array violates minItems: 1
-        "sections": [],
-    }
-
-    with pytest.raises(ValidationFailedError) as exc_info:
-        document_service.create_document(schema_id, document)
-
-    # Verify error contains validation details
-    error = exc_info.value
-    assert len(error.errors) > 0
-    # Check if any error mentions the validation issue
-    error_str = str(error.errors).lower()
-    assert "authors" in error_str or "minitems" in error_str or "too short" in error_str
-
-
 # P1.3: Document Reading - read_node (Happy Path)
 
 
@@ -354,6 +380,18 @@ def test_read_node_root(document_service, sample_schema, valid_full_doc, temp_st
     assert version == 1
 
 
+def test_read_node_empty_pointer(document_service, sample_schema, valid_full_doc):
+    """Test that the empty pointer also reads the full document"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_full_doc)
+
+    content, version = document_service.read_node(doc_id, "")
+
+    assert content == document_service.read_node(doc_id, "/")[0]
+    assert version == 1
+
+
 def test_read_node_simple_field(document_service, sample_schema, valid_full_doc):
     """Test reading a simple field using JSONPointer"""
     schema_id, _ = sample_schema
@@ -423,6 +461,19 @@ def test_read_node_document_not_found(document_service):
         document_service.read_node(non_existent_id, "/")
 
 
+def test_read_node_storage_error_not_masked(temp_storage, schema_service):
+    """Test that storage errors other than DocumentNotFoundError propagate unchanged"""
+
+    class FailingStorage(FileSystemStorage):
+        def _load_json(self, path):
+            raise OSError("volume not found")
+
+    service = DocumentService(FailingStorage(temp_storage.base_path), schema_service)
+
+    with pytest.raises(OSError):
+        service.read_node(str(DocumentId.generate()), "/")
+
+
 def test_read_node_path_not_found(document_service, sample_schema, valid_minimal_doc):
     """Test that reading non-existent path raises error"""
     from json_schema_core.domain.errors import PathNotFoundError
@@ -523,6 +574,73 @@ def test_update_node_updates_timestamp(
     assert updated_at > created_at
 
 
+def test_update_node_unchanged_value_is_noop(
+    document_service, sample_schema, valid_minimal_doc, temp_storage
+):
+    """Test that writing back the current value skips the write and keeps the version"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+    title, _ = document_service.read_node(doc_id, "/title")
+    before = temp_storage.read_metadata(doc_id)
+
+    value, version = document_service.update_node(doc_id, "/title", title, expected_version=1)
+
+    assert value == title
+    assert version == 1
+    assert temp_storage.read_metadata(doc_id) == before
+
+    # The version check still applies to no-op updates
+    with pytest.raises(VersionConflictError):
+        document_service.update_node(doc_id, "/title", title, expected_version=5)
+
+
+def test_update_node_keeps_other_metadata(
+    document_service, sample_schema, valid_minimal_doc, temp_storage
+):
+    """Test that update_node only changes version and updated_at in stored metadata"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+    before = temp_storage.read_metadata(doc_id)
+
+    document_service.update_node(doc_id, "/title", "Updated Title", expected_version=1)
+
+    after = temp_storage.read_metadata(doc_id)
+    assert after["version"] == 2
+    assert {k: v for k, v in after.items() if k not in ("version", "updated_at")} == {
+        k: v for k, v in before.items() if k not in ("version", "updated_at")
+    }
+
+
+def test_update_node_concurrent_write_conflicts(
+    document_service, sample_schema, valid_minimal_doc, temp_storage
+):
+    """Test that a write racing between load and save is detected, not overwritten"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    # Another writer commits version 2 right after this update loads version 1
+    load = document_service._load_document
+
+    def racing_load(doc_id):
+        document, metadata_dict = load(doc_id)
+        temp_storage.write_document_and_metadata(
+            doc_id, {**document, "title": "Other"}, {**metadata_dict, "version": 2}
+        )
+        return document, metadata_dict
+
+    document_service._load_document = racing_load
+
+    with pytest.raises(VersionConflictError) as exc_info:
+        document_service.update_node(doc_id, "/title", "Mine")
+
+    assert exc_info.value.expected == 1
+    assert exc_info.value.actual == 2
+    assert temp_storage.read_document(doc_id)["title"] == "Other"
+
+
 def test_update_node_validates_result(document_service, sample_schema, valid_minimal_doc):
     """Test that update_node validates the updated document"""
     schema_id, _ = sample_schema
@@ -535,6 +653,17 @@ def test_update_node_validates_result(document_service, sample_schema, valid_min
         document_service.update_node(doc_id, "/title", 12345, expected_version=1)
 
 
+def test_update_node_new_key_validates_parent(document_service, sample_schema, valid_minimal_doc):
+    """Test that adding a key via update_node is checked against the parent schema"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    # The root schema disallows additional properties
+    with pytest.raises(ValidationFailedError):
+        document_service.update_node(doc_id, "/unknown", "value", expected_version=1)
+
+
 def test_update_node_nested_field(document_service, sample_schema, valid_full_doc):
     """Test updating a nested field in a document"""
     schema_id, _ = sample_schema
@@ -555,6 +684,25 @@ def test_update_node_nested_field(document_service, sample_schema, valid_full_do
     assert section_title == "Updated Section Title"
 
 
+def test_update_node_uses_document_schema(document_service, sample_schema, temp_storage):
+    """Test that updates validate against the schema the document was created with"""
+    schema_id, _ = sample_schema
+
+    # A permissive schema used first, so it is not the only one the service has seen
+    loose_schema_id = str(DocumentId.generate())
+    temp_storage.write_document(loose_schema_id, {"type": "object"})
+    document_service.create_document(loose_schema_id, {"title": 1})
+
+    doc_id, metadata = document_service.create_document(
+        schema_id, {"title": "Test", "authors": ["Author"], "sections": []}
+    )
+    assert metadata.schema_id == schema_id
+    assert temp_storage.read_metadata(doc_id)["schema_id"] == schema_id
+
+    with pytest.raises(ValidationFailedError):
+        document_service.update_node(doc_id, "/title", 12345, expected_version=1)
+
+
 # P1.6: Document Updating - update_node (Optimistic Locking)
 
 
@@ -580,6 +728,21 @@ def test_update_node_version_conflict(document_service, sample_schema, valid_min
     assert error.actual == 2
 
 
+def test_update_node_without_expected_version(document_service, sample_schema, valid_minimal_doc):
+    """Test that update_node skips the version check when expected_version is None"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+    document_service.update_node(doc_id, "/title", "Title 2", expected_version=1)
+
+    # No expected_version: applies to whatever the current version is
+    _, new_version = document_service.update_node(doc_id, "/title", "Title 3")
+
+    assert new_version == 3
+    value, _ = document_service.read_node(doc_id, "/title")
+    assert value == "Title 3"
+
+
 def test_update_node_no_save_on_conflict(
     document_service, sample_schema, valid_minimal_doc, temp_storage
 ):
@@ -608,6 +771,115 @@ def test_update_node_no_save_on_conflict(
     assert metadata_dict["version"] == 2
 
 
+# apply_patches: several updates in one write
+
+
+def test_apply_patches_single_version_increment(
+    document_service, sample_schema, valid_full_doc, temp_storage
+):
+    """Test that apply_patches applies all patches and bumps the version once"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_full_doc)
+
+    values, new_version = document_service.apply_patches(
+        doc_id,
+        [
+            {"path": "/title", "value": "Patched"},
+            {"path": "/sections/0/title", "value": "First"},
+        ],
+        expected_version=1,
+    )
+
+    assert values == ["Patched", "First"]
+    assert new_version == 2
+
+    stored_doc = temp_storage.read_document(doc_id)
+    assert stored_doc["title"] == "Patched"
+    assert stored_doc["sections"][0]["title"] == "First"
+
+
+def test_apply_patches_no_save_on_invalid_patch(
+    document_service, sample_schema, valid_minimal_doc, temp_storage
+):
+    """Test that apply_patches saves nothing when any patch fails validation"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    with pytest.raises(ValidationFailedError):
+        document_service.apply_patches(
+            doc_id,
+            [{"path": "/title", "value": "Fine"}, {"path": "/authors", "value": 42}],
+            expected_version=1,
+        )
+
+    stored_doc = temp_storage.read_document(doc_id)
+    assert stored_doc["title"] == "Test"
+    assert temp_storage.read_metadata(doc_id)["version"] == 1
+
+
+def test_apply_patches_version_conflict(document_service, sample_schema, valid_minimal_doc):
+    """Test that apply_patches checks the expected version"""
+    from json_schema_core.domain.errors import VersionConflictError
+
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    with pytest.raises(VersionConflictError):
+        document_service.apply_patches(
+            doc_id, [{"path": "/title", "value": "Stale"}], expected_version=2
+        )
+
+
+# batch: mixed mutations in one write
+
+
+def test_batch_applies_mixed_mutations_once(
+    document_service, sample_schema, valid_full_doc, temp_storage
+):
+    """Test that a batch applies updates, creates and deletes with one version bump"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_full_doc)
+
+    with document_service.batch(doc_id, expected_version=1) as batch:
+        batch.update_node("/title", "Batched")
+        batch.create_node("/authors", "Third Author")
+        batch.delete_node("/sections/2")
+
+    assert batch.results == ["Batched", "/authors/2", valid_full_doc["sections"][2]]
+    assert batch.version == 2
+
+    stored_doc = temp_storage.read_document(doc_id)
+    assert stored_doc["title"] == "Batched"
+    assert stored_doc["authors"][-1] == "Third Author"
+    assert len(stored_doc["sections"]) == 2
+
+
+def test_batch_saves_nothing_on_failure(
+    document_service, sample_schema, valid_minimal_doc, temp_storage
+):
+    """Test that a batch saves nothing if a mutation is invalid or the block raises"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    with pytest.raises(ValidationFailedError):
+        with document_service.batch(doc_id) as batch:
+            batch.update_node("/title", "Fine")
+            batch.delete_node("/authors/0")
+
+    with pytest.raises(RuntimeError):
+        with document_service.batch(doc_id) as batch:
+            batch.update_node("/title", "Abandoned")
+            raise RuntimeError("caller gave up")
+
+    assert temp_storage.read_document(doc_id)["title"] == "Test"
+    assert temp_storage.read_metadata(doc_id)["version"] == 1
+
+
 # ============================================================================
 # Phase 1.7: create_node Tests
 # ============================================================================
@@ -621,11 +893,11 @@ def test_create_node_append_to_array(document_service, sample_schema, valid_mini
     doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
 
     # Append new author to array
-    new_value, new_version = document_service.create_node(
+    created_path, new_version = document_service.create_node(
         doc_id, "/authors", "New Author", expected_version=1
     )
 
-    assert new_value == "New Author"
+    assert created_path == "/authors/1"
     assert new_version == 2
 
     # Verify the array was updated
@@ -643,11 +915,11 @@ def test_create_node_add_to_object(document_service, sample_schema, valid_full_d
 
     # Add new section to sections array
     new_section = {"title": "New Section", "paragraphs": ["New content"]}
-    new_value, new_version = document_service.create_node(
+    created_path, new_version = document_service.create_node(
         doc_id, "/sections", new_section, expected_version=1
     )
 
-    assert new_value == new_section
+    assert created_path == "/sections/3"
     assert new_version == 2
 
     # Verify the section was added
@@ -767,6 +1039,17 @@ def test_delete_node_validates_result(document_service, sample_schema, valid_min
         document_service.delete_node(doc_id, "/authors/0", expected_version=1)
 
 
+def test_delete_node_top_level_validates_root(document_service, sample_schema, valid_minimal_doc):
+    """Test that deleting a top-level key is checked against the root schema"""
+    schema_id, _ = sample_schema
+
+    doc_id, _ = document_service.create_document(schema_id, valid_minimal_doc)
+
+    # title is required by the root schema
+    with pytest.raises(ValidationFailedError):
+        document_service.delete_node(doc_id, "/title", expected_version=1)
+
+
 def test_delete_node_version_conflict(document_service, sample_schema, valid_full_doc):
     """Test that delete_node detects version conflicts"""
     from json_schema_core.domain.errors import VersionConflictError
@@ -914,10 +1197,10 @@ def test_full_document_lifecycle(document_service, sample_schema, valid_full_doc
         "title": "New Section",
         "paragraphs": ["This is a new section added to the document."],
     }
-    created_section, version3 = document_service.create_node(
+    created_path, version3 = document_service.create_node(
         doc_id, "/sections", new_section, expected_version=2
     )
-    assert created_section == new_section
+    assert created_path == "/sections/3"
     assert version3 == 3
 
     # Verify section was added
@@ -2,23 +2,18 @@
 Tests for SchemaService - Schema loading and $ref resolution
 """
 
-import shutil
-import tempfile
-
 import pytest
 from json_schema_core.domain.document_id import DocumentId
 from json_schema_core.domain.errors import DocumentNotFoundError, ValidationFailedError
+from json_schema_core.services import schema_service as schema_service_module
 from json_schema_core.services.schema_service import SchemaService
 from json_schema_core.storage.file_storage import FileSystemStorage
 
 
 @pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory"""
-    temp_dir = tempfile.mkdtemp()
-    storage = FileSystemStorage(temp_dir)
-    yield storage
-    shutil.rmtree(temp_dir)
+def temp_storage(tmp_path):
+    """Create storage in a temporary directory, skipping fsync (durability isn't under test)"""
+    return FileSystemStorage(tmp_path, durable=False)
 
 
 @pytest.fixture
@@ -109,6 +104,80 @@ def test_resolve_cross_schema_ref(schema_service, temp_storage):
     assert "city" in loaded["properties"]["address"]["properties"]
 
 
+def test_resolve_local_ref_missing_target(schema_service, temp_storage):
+    """Test that a local $ref to a missing or non-object path fails to resolve"""
+    for ref in ("#/definitions/missing", "#/definitions/name/type/x"):
+        schema_id = str(DocumentId.generate())
+        schema = {
+            "definitions": {"name": {"type": "string"}},
+            "properties": {"name": {"$ref": ref}},
+        }
+        temp_storage.write_document(schema_id, schema)
+
+        with pytest.raises(ValidationFailedError):
+            schema_service.load_schema(schema_id)
+
+
+def test_resolve_refs_reads_each_schema_once(schema_service, temp_storage, monkeypatch):
+    """Test that repeated local and cross-schema refs read each schema once"""
+    address_id = DocumentId.generate()
+    temp_storage.write_document(
+        str(address_id), {"type": "object", "properties": {"city": {"type": "string"}}}
+    )
+
+    person_id = DocumentId.generate()
+    person_schema = {
+        "type": "object",
+        "definitions": {"name": {"type": "string"}},
+        "properties": {
+            "first": {"$ref": "#/definitions/name"},
+            "last": {"$ref": "#/definitions/name"},
+            "home": {"$ref": f"{address_id}"},
+            "work": {"$ref": f"{address_id}"},
+        },
+    }
+    temp_storage.write_document(str(person_id), person_schema)
+
+    reads = []
+    original_read = temp_storage.read_document
+
+    def tracked_read(doc_id):
+        reads.append(doc_id)
+        return original_read(doc_id)
+
+    monkeypatch.setattr(temp_storage, "read_document", tracked_read)
+
+    loaded = schema_service.load_schema(str(person_id))
+
+    assert sorted(reads) == sorted([str(person_id), str(address_id)])
+    assert loaded["properties"]["first"] == {"type": "string"}
+    assert loaded["properties"]["home"]["properties"]["city"] == {"type": "string"}
+    # Each occurrence is its own copy
+    assert loaded["properties"]["home"] is not loaded["properties"]["work"]
+
+
+def test_resolve_nested_local_refs(schema_service, temp_storage):
+    """Test that refs inside a ref target are resolved as well"""
+    schema_id = DocumentId.generate()
+    schema = {
+        "type": "object",
+        "definitions": {
+            "name": {"type": "string"},
+            "person": {"type": "object", "properties": {"name": {"$ref": "#/definitions/name"}}},
+        },
+        "properties": {
+            "owner": {"$ref": "#/definitions/person"},
+            "editor": {"$ref": "#/definitions/person"},
+        },
+    }
+    temp_storage.write_document(str(schema_id), schema)
+
+    loaded = schema_service.load_schema(str(schema_id))
+
+    for key in ("owner", "editor"):
+        assert loaded["properties"][key]["properties"]["name"] == {"type": "string"}
+
+
 # P0.5.2: Circular Reference Detection
 
 
@@ -171,6 +240,23 @@ def test_circular_ref_detection_deep(schema_service, temp_storage):
     assert "Circular reference detected" in exc_info.value.errors[0]["message"]
 
 
+def test_circular_local_ref_detection(schema_service, temp_storage):
+    """Test detecting a local $ref that points back into itself"""
+    schema_id = str(DocumentId.generate())
+    schema = {
+        "definitions": {
+            "node": {"type": "object", "properties": {"child": {"$ref": "#/definitions/node"}}}
+        },
+        "properties": {"root": {"$ref": "#/definitions/node"}},
+    }
+    temp_storage.write_document(schema_id, schema)
+
+    with pytest.raises(ValidationFailedError) as exc_info:
+        schema_service.load_schema(schema_id)
+
+    assert "Circular reference detected" in exc_info.value.errors[0]["message"]
+
+
 # P0.5.3: Schema Introspection
 
 
@@ -314,3 +400,141 @@ def test_cache_isolation(schema_service, temp_storage):
 
     # Second copy should be unaffected
     assert schema2["properties"]["name"]["default"] == "Original"
+
+
+# Validator Caching
+
+
+def test_get_validator_is_cached(schema_service, temp_storage):
+    """Test that the compiled validator is built once per schema"""
+    schema_id = str(DocumentId.generate())
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    temp_storage.write_document(schema_id, schema)
+
+    validator1 = schema_service.get_validator(schema_id)
+    validator2 = schema_service.get_validator(schema_id)
+
+    assert validator1 is validator2
+    assert validator1.schema == schema
+
+
+def test_validate_by_schema_id(schema_service, temp_storage):
+    """Test validating a document against a schema ID"""
+    schema_id = str(DocumentId.generate())
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}
+    temp_storage.write_document(schema_id, schema)
+
+    # Valid document should not raise
+    schema_service.validate(schema_id, {"name": "Test"})
+
+    with pytest.raises(ValidationFailedError):
+        schema_service.validate(schema_id, {"name": 42})
+
+
+def test_invalidate_schema(schema_service, temp_storage):
+    """Test that invalidate drops the cached schema and validator"""
+    schema_id = str(DocumentId.generate())
+    temp_storage.write_document(schema_id, {"type": "object"})
+    other_id = str(DocumentId.generate())
+    temp_storage.write_document(other_id, {"type": "string"})
+
+    validator = schema_service.get_validator(schema_id)
+    schema_service.get_validator(other_id)
+
+    # Update the schema in storage and invalidate it
+    temp_storage.write_document(schema_id, {"type": "array"})
+    schema_service.invalidate(schema_id)
+
+    reloaded = schema_service.get_validator(schema_id)
+    assert reloaded is not validator
+    assert reloaded.schema == {"type": "array"}
+
+    # Other schemas stay cached
+    assert other_id in schema_service._cache
+
+
+def test_cache_evicts_least_recently_used(temp_storage):
+    """Test that the schema and validator caches are bounded with LRU eviction"""
+    schema_service = SchemaService(temp_storage, max_cached_schemas=2)
+    ids = [str(DocumentId.generate()) for _ in range(3)]
+    for schema_id in ids:
+        temp_storage.write_document(schema_id, {"type": "object"})
+
+    first = schema_service.get_validator(ids[0])
+    schema_service.get_validator(ids[1])
+    schema_service.get_schema_node(ids[1], "/type")
+
+    # Touch the first schema so the second becomes least recently used
+    assert schema_service.get_validator(ids[0]) is first
+    schema_service.load_schema(ids[0])
+    schema_service.get_validator(ids[2])
+
+    assert list(schema_service._cache) == [ids[0], ids[2]]
+    assert list(schema_service._validators) == [ids[0], ids[2]]
+    assert all(key[0] != ids[1] for key in schema_service._node_cache)
+
+
+# Schema Node Lookup
+
+
+def test_get_schema_node(schema_service, temp_storage):
+    """Test resolving a sub-schema by JSONPointer path"""
+    schema_id = str(DocumentId.generate())
+    schema = {
+        "type": "object",
+        "definitions": {"name": {"type": "string", "minLength": 1}},
+        "properties": {"name": {"$ref": "#/definitions/name"}},
+    }
+    temp_storage.write_document(schema_id, schema)
+
+    node = schema_service.get_schema_node(schema_id, "/properties/name")
+    assert node == {"type": "string", "minLength": 1}
+
+    root = schema_service.get_schema_node(schema_id, "/")
+    assert root["type"] == "object"
+
+
+def test_get_schema_node_not_found(schema_service, temp_storage):
+    """Test that a missing schema path raises PathNotFoundError"""
+    from json_schema_core.domain.errors import PathNotFoundError
+
+    schema_id = str(DocumentId.generate())
+    temp_storage.write_document(schema_id, {"type": "object", "properties": {}})
+
+    with pytest.raises(PathNotFoundError):
+        schema_service.get_schema_node(schema_id, "/properties/missing")
+
+
+def test_get_schema_node_cached_and_isolated(schema_service, temp_storage):
+    """Test that node lookups are cached but return isolated copies"""
+    schema_id = str(DocumentId.generate())
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    temp_storage.write_document(schema_id, schema)
+
+    node1 = schema_service.get_schema_node(schema_id, "/properties/name")
+    node1["type"] = "integer"
+    node2 = schema_service.get_schema_node(schema_id, "/properties/name")
+
+    assert node2 == {"type": "string"}
+    assert (schema_id, "/properties/name") in schema_service._node_cache
+
+    schema_service.invalidate(schema_id)
+    assert (schema_id, "/properties/name") not in schema_service._node_cache
+
+
+def test_get_schema_node_cache_is_bounded(schema_service, temp_storage, monkeypatch):
+    """Test that the node cache evicts the least recently used nodes beyond its limit"""
+    monkeypatch.setattr(schema_service_module, "MAX_CACHED_NODES", 2)
+    schema_id = str(DocumentId.generate())
+    schema = {"type": "object", "properties": {"a": {}, "b": {}, "c": {}}}
+    temp_storage.write_document(schema_id, schema)
+
+    schema_service.get_schema_node(schema_id, "/properties/a")
+    schema_service.get_schema_node(schema_id, "/properties/b")
+    schema_service.get_schema_node(schema_id, "/properties/a")
+    schema_service.get_schema_node(schema_id, "/properties/c")
+
+    assert list(schema_service._node_cache) == [
+        (schema_id, "/properties/a"),
+        (schema_id, "/properties/c"),
+    ]
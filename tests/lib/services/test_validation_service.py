@@ -170,3 +170,110 @@ def test_apply_defaults_nested_objects():
 
     # Original unchanged
     assert "sections" not in document
+
+
+def test_apply_defaults_only_descends_into_present_objects():
+    """Test that nested defaults apply inside existing objects, not inside parent defaults."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string"},
+            "meta": {
+                "type": "object",
+                "default": {},
+                "properties": {"lang": {"type": "string", "default": "en"}},
+            },
+        },
+    }
+
+    service = ValidationService(schema)
+
+    assert service.apply_defaults({}) == {"meta": {}}
+    assert service.apply_defaults({"meta": {}}) == {"meta": {"lang": "en"}}
+    assert service.apply_defaults({"meta": "x"}) == {"meta": "x"}
+
+
+def test_has_defaults():
+    """Test that has_defaults reflects the defaults apply_defaults would use."""
+    nested = {
+        "type": "object",
+        "properties": {
+            "meta": {"type": "object", "properties": {"lang": {"type": "string", "default": "en"}}}
+        },
+    }
+    without = {
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "tags": {"type": "array"}},
+    }
+
+    assert ValidationService(nested).has_defaults
+    assert not ValidationService(without).has_defaults
+    assert not ValidationService({"type": "object"}).has_defaults
+
+
+def test_validate_node_checks_only_the_node():
+    """Test that validate_node checks the changed node against its sub-schema."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "title": {"type": "string"},
+            "items": {"type": "array", "items": {"type": "integer"}},
+        },
+        "required": ["title"],
+    }
+
+    service = ValidationService(schema)
+
+    # The rest of the document is assumed valid, so only /items/1 is inspected
+    document = {"title": 123, "items": [1, 2]}
+    service.validate_node(document, "/items/1")
+
+    document = {"title": "Test", "items": [1, "two"]}
+    with pytest.raises(ValidationFailedError) as exc_info:
+        service.validate_node(document, "/items/1")
+
+    assert exc_info.value.errors[0]["path"] == ["items", 1]
+
+
+def test_validate_node_falls_back_to_document():
+    """Test that validate_node validates the whole document when an ancestor isn't local."""
+    schema = {
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "value": {"type": "number"}},
+        "enum": [{"title": "Fixed", "value": 1}],
+    }
+
+    service = ValidationService(schema)
+
+    with pytest.raises(ValidationFailedError):
+        service.validate_node({"title": "Fixed", "value": 2}, "/value")
+
+
+def test_validate_node_cache_shares_additional_properties(monkeypatch):
+    """Test that node validators are shared across additionalProperties keys and bounded."""
+    from json_schema_core.services import validation_service as validation_service_module
+
+    monkeypatch.setattr(validation_service_module, "MAX_CACHED_NODE_VALIDATORS", 2)
+    schema = {
+        "type": "object",
+        "properties": {"title": {"type": "string"}, "count": {"type": "integer"}},
+        "additionalProperties": {"type": "integer"},
+    }
+
+    service = ValidationService(schema)
+    document = {"title": "Test", "count": 1, "a": 1, "b": 2, "c": 3}
+    for key in ("a", "b", "c"):
+        service.validate_node(document, f"/{key}")
+
+    assert len(service._node_validators) == 1
+
+    with pytest.raises(ValidationFailedError) as exc_info:
+        service.validate_node({"title": "Test", "d": "four"}, "/d")
+
+    assert exc_info.value.errors[0]["path"] == ["d"]
+
+    service.validate_node(document, "/title")
+    service.validate_node(document, "/count")
+
+    assert len(service._node_validators) == 2
+    assert ("title",) in service._node_validators
@@ -1,6 +1,7 @@
 """Tests for FileSystemStorage."""
 
 import json
+import os
 
 import pytest
 from json_schema_core.domain.errors import DocumentNotFoundError
@@ -79,6 +80,34 @@ def test_write_document_durable(tmp_path):
     assert saved_content == content
 
 
+def test_write_document_skips_sync_when_not_durable(tmp_path, monkeypatch):
+    """Test that durable=False writes atomically without syncing to disk."""
+    fsync_calls = []
+    open_flags = []
+    original_open = os.open
+
+    def tracked_open(path, flags, mode=0o777):
+        open_flags.append(flags)
+        return original_open(path, flags, mode)
+
+    monkeypatch.setattr(os, "fsync", fsync_calls.append)
+    monkeypatch.setattr(os, "open", tracked_open)
+
+    FileSystemStorage(tmp_path, durable=False).write_document("doc", {"a": 1})
+    assert fsync_calls == []
+    assert not open_flags[-1] & getattr(os, "O_DSYNC", 0)
+    assert json.loads((tmp_path / "doc.json").read_text()) == {"a": 1}
+    assert not (tmp_path / "doc.tmp").exists()
+
+    # Durable writes sync through O_DSYNC where available, else fsync
+    FileSystemStorage(tmp_path).write_document("doc", {"a": 2})
+    if hasattr(os, "O_DSYNC"):
+        assert open_flags[-1] & os.O_DSYNC
+    else:
+        assert len(fsync_calls) == 1
+    assert json.loads((tmp_path / "doc.json").read_text()) == {"a": 2}
+
+
 def test_read_document_returns_content(tmp_path):
     """Test that read_document returns the document content."""
     storage = FileSystemStorage(tmp_path)
@@ -93,6 +122,29 @@ def test_read_document_returns_content(tmp_path):
     assert result == content
 
 
+def test_read_document_memory_mapped(tmp_path):
+    """Test that documents above the mmap threshold read back identically."""
+    storage = FileSystemStorage(tmp_path, mmap_threshold=1)
+    doc_id = "test-doc-mmap"
+    content = {"title": "Mapped", "data": list(range(100))}
+
+    storage.write_document(doc_id, content)
+
+    assert storage.read_document(doc_id) == content
+
+
+def test_exists(tmp_path):
+    """Test that exists reports stored documents without reading them."""
+    storage = FileSystemStorage(tmp_path)
+    doc_id = "test-doc-exists"
+
+    assert not storage.exists(doc_id)
+
+    storage.write_document(doc_id, {"title": "Test"})
+
+    assert storage.exists(doc_id)
+
+
 def test_read_document_raises_not_found(tmp_path):
     """Test that read_document raises DocumentNotFoundError for missing documents."""
     storage = FileSystemStorage(tmp_path)
@@ -156,6 +208,25 @@ def test_read_metadata_missing_returns_none(tmp_path):
     assert result is None
 
 
+def test_read_document_with_metadata(tmp_path):
+    """Test that read_document_with_metadata returns both payloads in one call."""
+    storage = FileSystemStorage(tmp_path)
+    doc_id = "test-doc-both"
+    storage.write_document(doc_id, {"title": "Both"})
+    storage.write_metadata(doc_id, {"doc_id": doc_id, "version": 3})
+
+    document, metadata = storage.read_document_with_metadata(doc_id)
+    assert document == {"title": "Both"}
+    assert metadata == {"doc_id": doc_id, "version": 3}
+
+    # Missing metadata is reported as None, like read_metadata
+    storage.write_document("no-meta", {})
+    assert storage.read_document_with_metadata("no-meta") == ({}, None)
+
+    with pytest.raises(DocumentNotFoundError):
+        storage.read_document_with_metadata("missing")
+
+
 def test_metadata_includes_required_fields(tmp_path):
     """Test that metadata includes all required fields."""
     storage = FileSystemStorage(tmp_path)
@@ -195,6 +266,32 @@ def test_write_metadata_cleans_up_tmp_on_error(tmp_path):
     assert not tmp_file.exists()
 
 
+def test_write_document_and_metadata(tmp_path):
+    """Test that write_document_and_metadata stores both files."""
+    storage = FileSystemStorage(tmp_path)
+    doc_id = "test-doc-combined"
+
+    storage.write_document_and_metadata(doc_id, {"title": "A"}, {"doc_id": doc_id, "version": 1})
+
+    assert storage.read_document(doc_id) == {"title": "A"}
+    assert storage.read_metadata(doc_id) == {"doc_id": doc_id, "version": 1}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_write_document_and_metadata_failure_keeps_previous(tmp_path):
+    """Test that a failed combined write leaves both previous files untouched."""
+    storage = FileSystemStorage(tmp_path)
+    doc_id = "test-doc-combined-fail"
+    storage.write_document_and_metadata(doc_id, {"title": "A"}, {"version": 1})
+
+    with pytest.raises(TypeError):
+        storage.write_document_and_metadata(doc_id, {"title": "B"}, {"version": object()})
+
+    assert storage.read_document(doc_id) == {"title": "A"}
+    assert storage.read_metadata(doc_id) == {"version": 1}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
 def test_write_metadata_durable(tmp_path):
     """Test that write_metadata uses fsync for durability."""
     storage = FileSystemStorage(tmp_path)
@@ -339,3 +436,36 @@ def test_delete_document_missing_is_ok(tmp_path):
     meta_file = tmp_path / f"{doc_id}.meta.json"
     assert not doc_file.exists()
     assert not meta_file.exists()
+
+
+def test_list_documents_with_metadata(tmp_path):
+    """Test that list_documents_with_metadata returns a page of metadata in ID order."""
+    storage = FileSystemStorage(tmp_path)
+
+    for i in range(5):
+        doc_id = f"doc-{i:02d}"
+        storage.write_document_and_metadata(doc_id, {}, {"doc_id": doc_id, "version": 1})
+
+    # Schemas and other files without metadata are not listed
+    storage.write_document("schema", {"type": "object"})
+
+    page = storage.list_documents_with_metadata(limit=2, offset=1)
+    assert [m["doc_id"] for m in page] == ["doc-01", "doc-02"]
+    assert [m["doc_id"] for m in page] == storage.list_documents(limit=2, offset=1)
+
+
+def test_cas_write(tmp_path):
+    """Test that cas_write only writes when the stored version matches."""
+    storage = FileSystemStorage(tmp_path)
+    doc_id = "test-doc-cas"
+    storage.write_document_and_metadata(doc_id, {"n": 1}, {"doc_id": doc_id, "version": 1})
+
+    assert storage.cas_write(doc_id, 1, {"n": 2}, {"doc_id": doc_id, "version": 2})
+    assert storage.read_document(doc_id) == {"n": 2}
+
+    # A second writer based on version 1 loses
+    assert not storage.cas_write(doc_id, 1, {"n": 3}, {"doc_id": doc_id, "version": 2})
+    assert storage.read_document(doc_id) == {"n": 2}
+
+    # Missing documents never match
+    assert not storage.cas_write("missing", 1, {}, {"version": 2})
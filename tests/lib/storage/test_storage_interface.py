@@ -8,3 +8,31 @@ def test_cannot_instantiate_interface():
     """Test that StorageInterface cannot be instantiated directly."""
     with pytest.raises(TypeError, match="Can't instantiate abstract class"):
         StorageInterface()
+
+
+def test_subclass_without_cas_write_cannot_be_instantiated():
+    """Test that a backend must implement cas_write to be constructed."""
+
+    class NoCasStorage(StorageInterface):
+        """Storage implementing everything except cas_write."""
+
+        def read_document(self, doc_id):
+            return {}
+
+        def write_document(self, doc_id, content):
+            pass
+
+        def delete_document(self, doc_id):
+            pass
+
+        def list_documents(self, limit=100, offset=0):
+            return []
+
+        def read_metadata(self, doc_id):
+            return None
+
+        def write_metadata(self, doc_id, metadata):
+            pass
+
+    with pytest.raises(TypeError, match="cas_write"):
+        NoCasStorage()
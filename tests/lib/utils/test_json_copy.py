@@ -0,0 +1,68 @@
+"""Tests for JSON copy utilities."""
+
+from json_schema_core.utils.json_copy import clone_json
+
+
+def test_clone_json_is_independent_deep_copy():
+    """Test that clone_json returns an equal copy sharing no containers."""
+    original = {"a": [1, {"b": None}], "c": {"d": 1.5, "e": True}}
+
+    result = clone_json(original)
+
+    assert result == original
+    result["a"][1]["b"] = "changed"
+    result["c"]["e"] = False
+    assert original == {"a": [1, {"b": None}], "c": {"d": 1.5, "e": True}}
+
+
+def test_clone_json_falls_back_for_non_json_values():
+    """Test that values orjson can't encode are still deep-copied."""
+    original = {1: ["non-string key"], "big": 2**70}
+
+    result = clone_json(original)
+
+    assert result == original
+    assert result[1] is not original[1]
+
+
+def test_clone_json_fallback_copies_nested_containers():
+    """Test that the fallback copy shares no containers, including non-JSON ones."""
+    original = {"big": 2**70, "items": [{"a": 1}], "tags": {"x"}}
+
+    result = clone_json(original)
+
+    assert result == original
+    assert result["items"][0] is not original["items"][0]
+    assert result["tags"] is not original["tags"]
+
+
+def test_clone_json_keeps_non_finite_floats():
+    """Test that NaN and infinities survive the copy instead of becoming null."""
+    original = {"nan": [float("nan")], "inf": float("inf"), "ninf": float("-inf")}
+
+    result = clone_json(original)
+
+    assert result["nan"][0] != result["nan"][0]
+    assert result["inf"] == float("inf")
+    assert result["ninf"] == float("-inf")
+    assert result["nan"] is not original["nan"]
+
+
+def test_clone_json_nullable_schema_uses_fast_path(monkeypatch):
+    """Test that null values and "null" text don't force the fallback copy."""
+    from json_schema_core.utils import json_copy
+
+    def no_fallback(obj):
+        raise AssertionError("fallback copy used")
+
+    monkeypatch.setattr(json_copy, "_copy_tree", no_fallback)
+    original = {
+        "type": "object",
+        "properties": {"note": {"type": ["string", "null"], "nullable": True, "default": None}},
+    }
+
+    result = clone_json(original)
+
+    assert result == original
+    assert result["properties"]["note"] is not original["properties"]["note"]
+    assert result["properties"]["note"]["type"] is not original["properties"]["note"]["type"]
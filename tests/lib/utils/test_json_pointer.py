@@ -4,38 +4,41 @@ import pytest
 from json_schema_core.domain.errors import PathNotFoundError
 from json_schema_core.utils.json_pointer import (
     delete_pointer,
+    delete_pointer_inplace,
     parse_pointer,
     resolve_pointer,
     set_pointer,
+    set_pointer_inplace,
+    tokenize_pointer,
 )
 
 
 def test_parse_pointer():
     """Test parsing a simple JSON Pointer."""
     result = parse_pointer("/title")
-    assert result == ["title"]
+    assert result == ("title",)
 
 
 def test_parse_nested_pointer():
     """Test parsing a nested JSON Pointer."""
     result = parse_pointer("/sections/0/paragraphs/1")
-    assert result == ["sections", "0", "paragraphs", "1"]
+    assert result == ("sections", "0", "paragraphs", "1")
 
 
 def test_parse_root_pointer():
     """Test parsing root pointer."""
     result = parse_pointer("")
-    assert result == []
+    assert result == ()
 
 
 def test_parse_pointer_with_special_chars():
     """Test parsing pointer with escaped characters."""
     # ~0 represents ~ and ~1 represents /
     result = parse_pointer("/field~0name")
-    assert result == ["field~name"]
+    assert result == ("field~name",)
 
     result = parse_pointer("/field~1name")
-    assert result == ["field/name"]
+    assert result == ("field/name",)
 
 
 def test_resolve_pointer():
@@ -63,6 +66,19 @@ def test_resolve_pointer_array():
     assert result == "third"
 
 
+def test_resolve_pointer_array_rejects_non_decimal_index():
+    """Test that only plain decimal components index into arrays."""
+    document = {"items": ["first", "second", "third"]}
+
+    for pointer in ("/items/-1", "/items/+1", "/items/ 1", "/items/1_0", "/items/3"):
+        with pytest.raises(PathNotFoundError):
+            resolve_pointer(document, pointer)
+        with pytest.raises(PathNotFoundError):
+            set_pointer(document, pointer, "x")
+        with pytest.raises(PathNotFoundError):
+            delete_pointer(document, pointer)
+
+
 def test_resolve_pointer_complex():
     """Test resolving complex nested pointer."""
     document = {
@@ -79,6 +95,23 @@ def test_resolve_pointer_complex():
     assert result == "para4"
 
 
+def test_resolve_pointer_numeric_object_key():
+    """Test that numeric components still address object keys as strings."""
+    document = {"0": "zero", "items": [{"1": "one"}]}
+
+    assert resolve_pointer(document, "/0") == "zero"
+    assert resolve_pointer(document, "/items/0/1") == "one"
+
+
+def test_resolve_pointer_repeated_calls():
+    """Test that a repeated pointer resolves against each document independently."""
+    assert resolve_pointer({"a": [1, 2]}, "/a/1") == 2
+    assert resolve_pointer({"a": [3, 4]}, "/a/1") == 4
+
+    with pytest.raises(PathNotFoundError):
+        resolve_pointer({"a": {"x": 1}}, "/a/1")
+
+
 def test_resolve_pointer_not_found():
     """Test that resolve_pointer raises detailed error for missing paths."""
     document = {"a": {"b": "value"}}
@@ -91,6 +124,7 @@ def test_resolve_pointer_not_found():
     assert error.path == "/a/b/c"
     # The error message should provide guidance
     assert "path" in str(error).lower()
+    assert error.segment == "c"
 
 
 def test_resolve_pointer_missing_intermediate():
@@ -103,6 +137,8 @@ def test_resolve_pointer_missing_intermediate():
 
     error = exc_info.value
     assert error.path == "/a/b/c"
+    assert error.segment == "b"
+    assert "'b'" in str(error)
 
 
 def test_resolve_root_pointer():
@@ -214,6 +250,71 @@ def test_delete_pointer_missing_field():
         delete_pointer(document, "/a/missing")
 
 
+def test_set_and_delete_pointer_share_untouched_subtrees():
+    """Test that set_pointer and delete_pointer copy only the path they change."""
+    document = {"a": {"b": [1, 2], "c": {"d": 1}}, "e": {"f": 2}}
+
+    result = set_pointer(document, "/a/b/0", 9)
+    assert result == {"a": {"b": [9, 2], "c": {"d": 1}}, "e": {"f": 2}}
+    assert document["a"]["b"] == [1, 2]
+    assert result["a"] is not document["a"]
+    assert result["a"]["c"] is document["a"]["c"]
+    assert result["e"] is document["e"]
+
+    result = delete_pointer(document, "/a/c/d")
+    assert result["a"]["c"] == {}
+    assert document["a"]["c"] == {"d": 1}
+    assert result["a"]["b"] is document["a"]["b"]
+
+    with pytest.raises(PathNotFoundError):
+        set_pointer(document, "/a/b/0/x", 1)
+    assert document == {"a": {"b": [1, 2], "c": {"d": 1}}, "e": {"f": 2}}
+
+
+def test_set_pointer_inplace():
+    """Test that set_pointer_inplace modifies the document without copying it."""
+    nested = {"field": "old"}
+    document = {"nested": nested, "items": [1, 2]}
+
+    set_pointer_inplace(document, "/nested/field", "new")
+    set_pointer_inplace(document, "/items/0", 10)
+    set_pointer_inplace(document, "/added", True)
+
+    assert document == {"nested": {"field": "new"}, "items": [10, 2], "added": True}
+    assert document["nested"] is nested
+
+    with pytest.raises(PathNotFoundError):
+        set_pointer_inplace(document, "/items/5", 0)
+
+
+def test_delete_pointer_inplace():
+    """Test that delete_pointer_inplace modifies the document and returns the value."""
+    document = {"a": {"b": "value"}, "items": ["first", "second"]}
+
+    assert delete_pointer_inplace(document, "/a/b") == "value"
+    assert delete_pointer_inplace(document, "/items/0") == "first"
+    assert document == {"a": {}, "items": ["second"]}
+
+    with pytest.raises(PathNotFoundError):
+        delete_pointer_inplace(document, "/a/b")
+
+
+def test_pointer_functions_accept_tokens():
+    """Test that a tokenized pointer can be reused across pointer functions."""
+    document = {"a/b": {"items": [1, 2]}}
+    tokens = tokenize_pointer("/a~1b/items/1")
+
+    assert tokenize_pointer("/a~1b/items/1") is tokens
+    assert resolve_pointer(document, tokens) == 2
+    set_pointer_inplace(document, tokens, 3)
+    assert delete_pointer_inplace(document, tokens) == 3
+
+    # Errors still report the pointer string
+    with pytest.raises(PathNotFoundError) as exc_info:
+        resolve_pointer(document, tokens)
+    assert exc_info.value.path == "/a~1b/items/1"
+
+
 def test_parse_pointer_invalid():
     """Test that pointer must start with /."""
     with pytest.raises(ValueError, match="must start with"):
@@ -234,3 +335,16 @@ def test_delete_pointer_root_error():
 
     with pytest.raises(ValueError, match="root"):
         delete_pointer(document, "")
+
+
+def test_parse_pointer_is_cached():
+    """Test that repeated parses of a pointer return the same tuple."""
+    assert parse_pointer("/tags/0") is parse_pointer("/tags/0")
+
+
+def test_parse_pointer_interns_components():
+    """Test that equal components from different pointers share one string object."""
+    first = parse_pointer("/properties/title")
+    second = parse_pointer("/definitions/" + "".join(["prop", "erties"]))
+
+    assert first[0] is second[1]